@@ -14,7 +14,10 @@ Analyzes git history for continuous intelligence:
 Requires: git CLI available in PATH
 
 Usage:
-    python git_tracker.py <project-root> [--output git_history.json] [--commits 50]
+    python git_tracker.py <project-root> [--output git_history.json] [--commits 50] [--minimal]
+
+--minimal keeps only file churn, change sizes and hotspots, skipping the
+recent-activity, author and velocity passes (for fast CLI/CI paths).
 
 Part of the codebase-analyzer WithAI ability.
 """
@@ -23,22 +26,44 @@ import os
 import sys
 import json
 import argparse
+import functools
 import subprocess
+import threading
+from array import array
 from pathlib import Path
 from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+@functools.lru_cache(maxsize=256)
+def _is_git_repo(path: str) -> bool:
+    """Check whether an absolute path is a git work tree root (cached)."""
+    git_path = os.path.join(path, '.git')
+    if os.path.isdir(git_path):
+        return True
+    # Linked worktrees and submodules have a .git file pointing at the real dir
+    try:
+        with open(git_path, 'rb') as f:
+            return f.read(8) == b'gitdir: '
+    except OSError:
+        return False
 
 
 class GitTracker:
     """Analyze git history for trend detection and hotspot identification."""
 
-    def __init__(self, root_path: str, max_commits: int = 50):
+    def __init__(self, root_path: str, max_commits: int = 50, minimal: bool = False):
         self.root = Path(root_path).resolve()
         self.max_commits = max_commits
+        self.minimal = minimal
 
         # Verify git repo
-        if not (self.root / '.git').exists():
+        if not _is_git_repo(str(self.root)):
             raise ValueError(f"Not a git repository: {self.root}")
 
     def analyze(self) -> dict:
@@ -46,9 +71,15 @@ class GitTracker:
         commits = self._get_commit_log()
         file_changes = self._get_file_change_history()
         file_churn = self._compute_file_churn(file_changes)
-        recent_activity = self._get_recent_activity(commits)
-        author_stats = self._compute_author_stats(commits)
-        velocity = self._compute_velocity(commits)
+        recent_activity, author_stats, velocity = {}, [], {}
+        if not self.minimal:
+            # Parsed once and shared by the date-based consumers below
+            commit_dates = self._parse_commit_dates(commits)
+            recent_activity = self._get_recent_activity(
+                commits, commit_dates, self._get_commit_log(since_days=30),
+            )
+            author_stats = self._compute_author_stats(commits)
+            velocity = self._compute_velocity(commits, commit_dates)
         change_sizes = self._get_change_sizes()
 
         return {
@@ -77,21 +108,60 @@ class GitTracker:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return ''
 
-    def _get_commit_log(self) -> list[dict]:
-        """Get structured commit log."""
+    def _stream_git(self, args: list[str], sep: bytes = b'\n') -> Iterator[bytes]:
+        """Execute a git command and yield its stdout split on ``sep``.
+
+        Records are yielded as they arrive, so only the current chunk of the
+        log is held in memory rather than the whole output.
+        """
+        try:
+            proc = subprocess.Popen(
+                ['git'] + args,
+                cwd=str(self.root),
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            return
+
+        # Drain stderr so a chatty git can't fill that pipe and stall stdout
+        drain = threading.Thread(target=proc.stderr.read, daemon=True)
+        drain.start()
+        # Same 30s budget as _run_git; a killed git just ends the stream
+        timer = threading.Timer(30, proc.kill)
+        timer.start()
+        try:
+            pending = b''
+            for chunk in iter(lambda: proc.stdout.read1(65536), b''):
+                records = (pending + chunk).split(sep)
+                pending = records.pop()
+                yield from records
+            if pending:
+                yield pending
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+            drain.join()
+
+    def _get_commit_log(self, since_days: Optional[int] = None) -> list[dict]:
+        """Get structured commit log.
+
+        With ``since_days`` the log covers that time window instead of the
+        last ``max_commits`` commits, letting git's revwalk do the pruning.
+        """
+        limit = f'--since={since_days} days ago' if since_days else f'-{self.max_commits}'
         # Format: hash|author|date|subject
-        log = self._run_git([
-            'log', f'-{self.max_commits}',
+        log = self._stream_git([
+            'log', limit,
             '--pretty=format:%H|%an|%aI|%s',
             '--no-merges',
         ])
 
-        if not log:
-            return []
-
         commits = []
-        for line in log.split('\n'):
-            parts = line.split('|', 3)
+        for line in log:
+            parts = line.decode('utf-8', 'replace').split('|', 3)
             if len(parts) >= 4:
                 commits.append({
                     'hash': parts[0][:8],
@@ -104,144 +174,188 @@ class GitTracker:
 
     def _get_file_change_history(self) -> list[dict]:
         """Get file-level change details for each commit."""
-        log = self._run_git([
+        # -z emits NUL-terminated numstat records with unquoted paths, so
+        # names containing newlines or non-UTF-8 bytes survive intact and
+        # only the paths themselves ever get decoded.
+        tokens = self._stream_git([
             'log', f'-{self.max_commits}',
             '--pretty=format:COMMIT:%H|%aI',
-            '--numstat', '--no-merges',
-        ])
-
-        if not log:
-            return []
+            '--numstat', '-z', '--no-merges',
+        ], sep=b'\0')
 
         changes = []
         current_commit = None
         current_date = None
 
-        for line in log.split('\n'):
-            if line.startswith('COMMIT:'):
-                parts = line[7:].split('|')
+        for token in tokens:
+            if token.startswith(b'COMMIT:'):
+                # The first numstat record shares a token with the header line
+                header, _, token = token.partition(b'\n')
+                parts = header[7:].decode('utf-8', 'replace').split('|')
                 current_commit = parts[0][:8]
                 current_date = parts[1] if len(parts) > 1 else ''
-            elif line.strip() and current_commit:
-                parts = line.split('\t')
-                if len(parts) == 3:
-                    added = int(parts[0]) if parts[0] != '-' else 0
-                    deleted = int(parts[1]) if parts[1] != '-' else 0
-                    filepath = parts[2]
-                    changes.append({
-                        'commit': current_commit,
-                        'date': current_date,
-                        'file': filepath,
-                        'added': added,
-                        'deleted': deleted,
-                        'total_change': added + deleted,
-                    })
+            if not token or not current_commit:
+                continue
+
+            parts = token.split(b'\t', 2)
+            if len(parts) != 3:
+                continue
+            raw_path = parts[2]
+            if not raw_path:
+                # Renames/copies: "added\tdeleted\t" then old and new paths
+                next(tokens, b'')
+                raw_path = next(tokens, b'')
+
+            added = int(parts[0]) if parts[0] != b'-' else 0
+            deleted = int(parts[1]) if parts[1] != b'-' else 0
+            changes.append({
+                'commit': current_commit,
+                'date': current_date,
+                'file': raw_path.decode('utf-8', 'surrogateescape'),
+                'added': added,
+                'deleted': deleted,
+                'total_change': added + deleted,
+            })
 
         return changes
 
     def _compute_file_churn(self, file_changes: list) -> list[dict]:
         """Compute change frequency and volume per file."""
-        churn = defaultdict(lambda: {
-            'change_count': 0, 'total_added': 0, 'total_deleted': 0,
-            'total_churn': 0, 'commits': set(), 'last_changed': '',
-        })
+        # Parallel columns indexed by file_idx[path]; the int columns are
+        # unboxed array('q') storage rather than a dict of Python ints per file.
+        file_idx = {}
+        files = []
+        counts = array('q')
+        added = array('q')
+        deleted = array('q')
+        last_changed = []
 
         for change in file_changes:
             fp = change['file']
-            churn[fp]['change_count'] += 1
-            churn[fp]['total_added'] += change['added']
-            churn[fp]['total_deleted'] += change['deleted']
-            churn[fp]['total_churn'] += change['total_change']
-            churn[fp]['commits'].add(change['commit'])
-            if not churn[fp]['last_changed'] or change['date'] > churn[fp]['last_changed']:
-                churn[fp]['last_changed'] = change['date']
-
-        result = []
-        for fp, stats in churn.items():
-            result.append({
+            i = file_idx.get(fp)
+            if i is None:
+                i = file_idx[fp] = len(files)
+                files.append(fp)
+                counts.append(1)
+                added.append(change['added'])
+                deleted.append(change['deleted'])
+                last_changed.append(change['date'])
+                continue
+            counts[i] += 1
+            added[i] += change['added']
+            deleted[i] += change['deleted']
+            if change['date'] > last_changed[i]:
+                last_changed[i] = change['date']
+
+        result = [
+            {
                 'file': fp,
-                'change_count': stats['change_count'],
-                'unique_commits': len(stats['commits']),
-                'total_added': stats['total_added'],
-                'total_deleted': stats['total_deleted'],
-                'total_churn': stats['total_churn'],
-                'last_changed': stats['last_changed'],
-                'churn_ratio': round(stats['total_deleted'] / max(stats['total_added'], 1), 2),
-            })
+                'change_count': n,
+                # file_changes has one row per (commit, file), so every
+                # change is already a distinct commit
+                'unique_commits': n,
+                'total_added': a,
+                'total_deleted': d,
+                'total_churn': a + d,
+                'last_changed': last,
+                'churn_ratio': d / max(a, 1),
+            }
+            for fp, n, a, d, last in zip(files, counts, added, deleted, last_changed)
+        ]
 
         return sorted(result, key=lambda x: x['total_churn'], reverse=True)
 
-    def _get_recent_activity(self, commits: list, days: int = 30) -> dict:
-        """Analyze activity in the last N days."""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent = []
-
+    @staticmethod
+    def _parse_commit_dates(commits: list) -> list[Optional[datetime]]:
+        """Parse commit dates to naive datetimes, aligned with ``commits``."""
+        dates = []
         for c in commits:
             try:
-                commit_date = datetime.fromisoformat(c['date'].replace('Z', '+00:00')).replace(tzinfo=None)
-                if commit_date >= cutoff:
-                    recent.append(c)
-            except:
-                pass
-
-        daily_counts = defaultdict(int)
-        for c in recent:
-            try:
-                day = c['date'][:10]
-                daily_counts[day] += 1
+                dates.append(datetime.fromisoformat(c['date'].replace('Z', '+00:00')).replace(tzinfo=None))
             except:
-                pass
+                dates.append(None)
+        return dates
+
+    def _get_recent_activity(self, commits: list, commit_dates: list,
+                             windowed: list, days: int = 30) -> dict:
+        """Analyze activity in the last N days.
+
+        ``windowed`` comes from ``git log --since`` and needs no date check.
+        git stops that revwalk at the first old-enough commit, so backdated
+        or rebased history can hide in-window commits; those are recovered
+        from ``commits`` by SHA and filtered here.
+        """
+        cutoff = datetime.now() - timedelta(days=days)
+        recent = list(windowed)
+        seen = {c['full_hash'] for c in windowed}
+
+        for c, commit_date in zip(commits, commit_dates):
+            if commit_date is not None and commit_date >= cutoff and c['full_hash'] not in seen:
+                recent.append(c)
+
+        # git log is newest-first, so walking it backwards inserts days in
+        # ascending order; only out-of-order history needs the sort.
+        daily_counts = {}
+        in_order = True
+        prev_day = ''
+        for c in reversed(recent):
+            day = c['date'][:10]
+            if day < prev_day:
+                in_order = False
+            prev_day = day
+            daily_counts[day] = daily_counts.get(day, 0) + 1
+        if not in_order:
+            daily_counts = dict(sorted(daily_counts.items()))
 
         return {
             'period_days': days,
             'total_commits': len(recent),
-            'avg_commits_per_day': round(len(recent) / days, 2) if days > 0 else 0,
+            'avg_commits_per_day': len(recent) / days if days > 0 else 0,
             'active_days': len(daily_counts),
-            'most_active_day': max(daily_counts.items(), key=lambda x: x[1])[0] if daily_counts else None,
-            'daily_breakdown': dict(sorted(daily_counts.items())),
+            # Ties go to the most recent day
+            'most_active_day': max(reversed(daily_counts), key=daily_counts.get) if daily_counts else None,
+            'daily_breakdown': daily_counts,
         }
 
     def _compute_author_stats(self, commits: list) -> list[dict]:
         """Compute per-author contribution statistics."""
-        authors = defaultdict(lambda: {'commits': 0, 'first_commit': '', 'last_commit': ''})
-
+        # author -> [commits, first_commit, last_commit]
+        authors = {}
         for c in commits:
-            author = c['author']
-            authors[author]['commits'] += 1
-            if not authors[author]['first_commit'] or c['date'] < authors[author]['first_commit']:
-                authors[author]['first_commit'] = c['date']
-            if not authors[author]['last_commit'] or c['date'] > authors[author]['last_commit']:
-                authors[author]['last_commit'] = c['date']
-
-        total = sum(a['commits'] for a in authors.values())
-        result = []
-        for name, stats in authors.items():
-            result.append({
+            date = c['date']
+            stats = authors.get(c['author'])
+            if stats is None:
+                authors[c['author']] = [1, date, date]
+                continue
+            stats[0] += 1
+            if date < stats[1]:
+                stats[1] = date
+            elif date > stats[2]:
+                stats[2] = date
+
+        total = len(commits)
+        result = [
+            {
                 'author': name,
-                'commits': stats['commits'],
-                'percentage': round(stats['commits'] / total * 100, 1) if total > 0 else 0,
-                'first_commit': stats['first_commit'],
-                'last_commit': stats['last_commit'],
-            })
+                'commits': count,
+                'percentage': count / total * 100,
+                'first_commit': first,
+                'last_commit': last,
+            }
+            for name, (count, first, last) in authors.items()
+        ]
 
         return sorted(result, key=lambda x: x['commits'], reverse=True)
 
-    def _compute_velocity(self, commits: list) -> dict:
+    def _compute_velocity(self, commits: list, commit_dates: list) -> dict:
         """Compute development velocity metrics."""
         if len(commits) < 2:
             return {'commits_per_week': 0, 'trend': 'insufficient_data'}
 
-        dates = []
-        for c in commits:
-            try:
-                dates.append(datetime.fromisoformat(c['date'].replace('Z', '+00:00')).replace(tzinfo=None))
-            except:
-                pass
-
+        dates = sorted(d for d in commit_dates if d is not None)
         if len(dates) < 2:
             return {'commits_per_week': 0, 'trend': 'insufficient_data'}
 
-        dates.sort()
         total_days = (dates[-1] - dates[0]).days or 1
         total_weeks = total_days / 7
 
@@ -265,11 +379,11 @@ class GitTracker:
 
         return {
             'total_span_days': total_days,
-            'commits_per_week': round(len(commits) / max(total_weeks, 0.1), 2),
-            'commits_per_day': round(len(commits) / total_days, 2),
+            'commits_per_week': len(commits) / max(total_weeks, 0.1),
+            'commits_per_day': len(commits) / total_days,
             'trend': trend,
-            'first_half_rate': round(first_rate * 7, 2),  # per week
-            'second_half_rate': round(second_rate * 7, 2),
+            'first_half_rate': first_rate * 7,  # per week
+            'second_half_rate': second_rate * 7,
         }
 
     def _get_change_sizes(self) -> list[dict]:
@@ -354,10 +468,11 @@ class GitTracker:
         if not commits:
             return "No git history available."
 
-        parts = [
-            f"{len(commits)} commits analyzed.",
-            f"Development velocity: {velocity.get('commits_per_week', 0)} commits/week ({velocity.get('trend', 'unknown')}).",
-        ]
+        parts = [f"{len(commits)} commits analyzed."]
+        if velocity:
+            parts.append(
+                f"Development velocity: {round(velocity.get('commits_per_week', 0), 2)} commits/week ({velocity.get('trend', 'unknown')})."
+            )
 
         if file_churn:
             top_file = file_churn[0]
@@ -383,6 +498,37 @@ def analyze_no_git(root_path: str) -> dict:
     }
 
 
+# Metrics are kept at full precision and rounded once here, at output time.
+# Fields not listed are rounded to 2 places.
+FLOAT_PRECISION = {'percentage': 1}
+
+
+def _round_floats(obj):
+    """Return a copy of ``obj`` with every float rounded for output."""
+    if isinstance(obj, dict):
+        return {
+            k: round(v, FLOAT_PRECISION.get(k, 2)) if type(v) is float else _round_floats(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_round_floats(v) for v in obj]
+    if type(obj) is float:
+        return round(obj, 2)
+    return obj
+
+
+def _dump_json(result: dict) -> bytes:
+    """Serialize the result, using orjson when it is installed."""
+    result = _round_floats(result)
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str)
+        except orjson.JSONEncodeError:
+            # e.g. surrogate-escaped paths, which only stdlib json accepts
+            pass
+    return json.dumps(result, indent=2, default=str).encode('utf-8')
+
+
 # ─── CLI ───────────────────────────────────────────────────────────────────────
 
 def main():
@@ -390,22 +536,23 @@ def main():
     parser.add_argument('project_path', help='Path to project root')
     parser.add_argument('--output', '-o', help='Output JSON file path')
     parser.add_argument('--commits', type=int, default=50, help='Max commits to analyze')
+    parser.add_argument('--minimal', action='store_true',
+                        help='Only churn, change sizes and hotspots (skips activity/author/velocity)')
     args = parser.parse_args()
 
-    try:
-        tracker = GitTracker(args.project_path, max_commits=args.commits)
+    if _is_git_repo(str(Path(args.project_path).resolve())):
+        tracker = GitTracker(args.project_path, max_commits=args.commits, minimal=args.minimal)
         result = tracker.analyze()
-    except ValueError:
+    else:
         result = analyze_no_git(args.project_path)
 
-    output = json.dumps(result, indent=2, default=str)
+    output = _dump_json(result)
     if args.output:
         Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(args.output, 'w') as f:
-            f.write(output)
+        Path(args.output).write_bytes(output)
         print(f"Git analysis saved to: {args.output}", file=sys.stderr)
     else:
-        print(output)
+        sys.stdout.buffer.write(output + b'\n')
 
 
 if __name__ == '__main__':
@@ -27,74 +27,153 @@ import os
 import re
 import sys
 import json
+import hashlib
+import functools
 import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Optional
 
+try:
+    import re2
+except ImportError:  # optional google-re2 engine; stdlib re is the fallback
+    re2 = None
+
 
 # ─── Pattern Definitions ──────────────────────────────────────────────────────
 
-SECRET_PATTERNS = [
-    # Variable assignment patterns
-    (r'(?i)(password|passwd|pwd)\s*=\s*["\'][^"\']{3,}["\']', 'Hardcoded password'),
-    (r'(?i)(api_?key|apikey)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded API key'),
-    (r'(?i)(secret|secret_?key)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded secret'),
-    (r'(?i)(token|auth_?token|access_?token)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded token'),
-    (r'(?i)(aws_secret|aws_access_key)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded AWS credential'),
-    # Inline secrets
-    (r'-----BEGIN (?:RSA |DSA |EC )?PRIVATE KEY-----', 'Private key in source'),
-    (r'(?i)bearer\s+[a-zA-Z0-9\-_.]{20,}', 'Hardcoded bearer token'),
-    # Connection strings with credentials
-    (r'(?i)(mysql|postgres|mongodb)://[^:]+:[^@]+@', 'Database URL with credentials'),
-]
+# Each entry is (regex, description, literals). Patterns are bytes: files are
+# scanned undecoded. ``literals`` are lowercase substrings, at least one of
+# which appears in any line the regex can match; lines without one are
+# skipped before the regex engine runs.
 
-SQL_INJECTION_PATTERNS = [
-    (r'\.execute\s*\(\s*f["\']', 'f-string in SQL execute()'),
-    (r'\.execute\s*\(\s*["\'].*%s', 'String formatting in SQL execute()'),
-    (r'\.execute\s*\(\s*.*\.format\(', '.format() in SQL execute()'),
-    (r'\.execute\s*\(\s*.*\+\s*', 'String concatenation in SQL execute()'),
-    (r'cursor\.execute\s*\(\s*f["\']', 'f-string in cursor.execute()'),
-]
+def _compile(patterns: list[tuple[bytes, str, tuple[bytes, ...]]]) -> list[tuple]:
+    """Compile (regex, description, literals) entries once at import time."""
+    return [(_compile_regex(regex), description, literals) for regex, description, literals in patterns]
 
-UNSAFE_DESERIALIZE_PATTERNS = [
-    (r'pickle\.loads?\s*\(', 'pickle.load() — arbitrary code execution risk'),
-    (r'yaml\.load\s*\([^)]*(?!Loader)', 'yaml.load() without safe Loader'),
-    (r'yaml\.unsafe_load\s*\(', 'yaml.unsafe_load() — arbitrary code execution'),
-    (r'marshal\.loads?\s*\(', 'marshal.load() — arbitrary code execution risk'),
-    (r'shelve\.open\s*\(', 'shelve.open() — uses pickle internally'),
-    (r'jsonpickle\.decode\s*\(', 'jsonpickle.decode() — arbitrary code execution'),
-]
 
-PATH_TRAVERSAL_PATTERNS = [
-    (r'open\s*\(\s*.*request\.(form|args|data|json)', 'User input in file open()'),
-    (r'os\.path\.join\s*\(\s*.*request\.(form|args|data|json)', 'User input in path join'),
-    (r'Path\s*\(\s*.*request\.(form|args|data|json)', 'User input in Path()'),
-    (r'send_file\s*\(\s*.*request\.(form|args|data|json)', 'User input in send_file()'),
-]
+def _compile_regex(regex: bytes):
+    """Compile with RE2 when installed, else (or if RE2 rejects it) with re.
 
-INSECURE_CRYPTO_PATTERNS = [
-    (r'hashlib\.(md5|sha1)\s*\(', 'Weak hash algorithm (MD5/SHA1)'),
-    (r'from\s+Crypto\.Cipher\s+import\s+DES', 'Weak cipher (DES)'),
-    (r'random\.(random|randint|choice|seed)\s*\(', 'Non-cryptographic random for potential security use'),
-]
+    RE2 runs in Latin-1 mode so it matches raw bytes like ``re`` does.
+    Patterns it cannot compile (e.g. lookarounds) stay on ``re``. A leading
+    inline ``(?i)`` becomes the ``re.IGNORECASE`` flag for ``re``.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.encoding = re2.Options.Encoding.LATIN1
+        options.log_errors = False
+        try:
+            return re2.compile(regex, options)
+        except re2.error:
+            pass
+    flags = 0
+    if regex.startswith(b'(?i)'):
+        regex, flags = regex[4:], re.IGNORECASE
+    return re.compile(regex, flags)
 
-DEBUG_LEFTOVER_PATTERNS = [
-    (r'(?i)# ?TODO\s*:?\s*.*secur', 'Security-related TODO'),
-    (r'(?i)# ?FIXME\s*:?\s*.*secur', 'Security-related FIXME'),
-    (r'(?i)# ?HACK\s*:', 'HACK comment in code'),
-    (r'app\.run\s*\(.*debug\s*=\s*True', 'Debug mode enabled in production'),
-    (r'FLASK_DEBUG\s*=\s*["\']?1', 'Flask debug mode enabled'),
-    (r'verify\s*=\s*False', 'SSL verification disabled'),
-    (r'print\s*\(.*password|print\s*\(.*secret|print\s*\(.*token', 'Sensitive data in print()'),
-]
 
-INPUT_VALIDATION_PATTERNS = [
-    (r'request\.(form|args|data|json)\[', 'Direct request data access without validation'),
-    (r'eval\s*\(\s*.*request', 'eval() with user input'),
-    (r'exec\s*\(\s*.*request', 'exec() with user input'),
-    (r'os\.system\s*\(\s*.*request', 'os.system() with user input — command injection'),
-    (r'subprocess\.\w+\s*\(\s*.*request', 'subprocess with user input — command injection'),
-]
+SECRET_PATTERNS = _compile([
+    # Variable assignment patterns
+    (rb'(?i)(password|passwd|pwd)\s*=\s*["\'][^"\']{3,}["\']', 'Hardcoded password',
+     (b'passw', b'pwd')),
+    (rb'(?i)(api_?key|apikey)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded API key',
+     (b'apikey', b'api_key')),
+    (rb'(?i)(secret|secret_?key)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded secret',
+     (b'secret',)),
+    (rb'(?i)(token|auth_?token|access_?token)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded token',
+     (b'token',)),
+    (rb'(?i)(aws_secret|aws_access_key)\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded AWS credential',
+     (b'aws_secret', b'aws_access_key')),
+    # Inline secrets
+    (rb'-----BEGIN (?:RSA |DSA |EC )?PRIVATE KEY-----', 'Private key in source',
+     (b'private key-----',)),
+    (rb'(?i)bearer\s+[a-zA-Z0-9\-_.]{20,}', 'Hardcoded bearer token',
+     (b'bearer',)),
+    # Connection strings with credentials
+    (rb'(?i)(mysql|postgres|mongodb)://[^:]+:[^@]+@', 'Database URL with credentials',
+     (b'://',)),
+])
+
+SQL_INJECTION_PATTERNS = _compile([
+    (rb'\.execute\s*\(\s*f["\']', 'f-string in SQL execute()',
+     (b'.execute',)),
+    (rb'\.execute\s*\(\s*["\'].*%s', 'String formatting in SQL execute()',
+     (b'.execute',)),
+    (rb'\.execute\s*\(\s*.*\.format\(', '.format() in SQL execute()',
+     (b'.execute',)),
+    (rb'\.execute\s*\(\s*.*\+\s*', 'String concatenation in SQL execute()',
+     (b'.execute',)),
+    (rb'cursor\.execute\s*\(\s*f["\']', 'f-string in cursor.execute()',
+     (b'cursor.execute',)),
+])
+
+UNSAFE_DESERIALIZE_PATTERNS = _compile([
+    (rb'pickle\.loads?\s*\(', 'pickle.load() — arbitrary code execution risk',
+     (b'pickle.load',)),
+    (rb'yaml\.load\s*\([^)]*(?!Loader)', 'yaml.load() without safe Loader',
+     (b'yaml.load',)),
+    (rb'yaml\.unsafe_load\s*\(', 'yaml.unsafe_load() — arbitrary code execution',
+     (b'yaml.unsafe_load',)),
+    (rb'marshal\.loads?\s*\(', 'marshal.load() — arbitrary code execution risk',
+     (b'marshal.load',)),
+    (rb'shelve\.open\s*\(', 'shelve.open() — uses pickle internally',
+     (b'shelve.open',)),
+    (rb'jsonpickle\.decode\s*\(', 'jsonpickle.decode() — arbitrary code execution',
+     (b'jsonpickle.decode',)),
+])
+
+PATH_TRAVERSAL_PATTERNS = _compile([
+    (rb'open\s*\(\s*.*request\.(form|args|data|json)', 'User input in file open()',
+     (b'request.',)),
+    (rb'os\.path\.join\s*\(\s*.*request\.(form|args|data|json)', 'User input in path join',
+     (b'os.path.join',)),
+    (rb'Path\s*\(\s*.*request\.(form|args|data|json)', 'User input in Path()',
+     (b'request.',)),
+    (rb'send_file\s*\(\s*.*request\.(form|args|data|json)', 'User input in send_file()',
+     (b'send_file',)),
+])
+
+INSECURE_CRYPTO_PATTERNS = _compile([
+    (rb'hashlib\.(md5|sha1)\s*\(', 'Weak hash algorithm (MD5/SHA1)',
+     (b'hashlib.',)),
+    (rb'from\s+Crypto\.Cipher\s+import\s+DES', 'Weak cipher (DES)',
+     (b'crypto.cipher',)),
+    (rb'random\.(random|randint|choice|seed)\s*\(', 'Non-cryptographic random for potential security use',
+     (b'random.',)),
+])
+
+DEBUG_LEFTOVER_PATTERNS = _compile([
+    (rb'(?i)# ?TODO\s*:?\s*.*secur', 'Security-related TODO',
+     (b'todo',)),
+    (rb'(?i)# ?FIXME\s*:?\s*.*secur', 'Security-related FIXME',
+     (b'fixme',)),
+    (rb'(?i)# ?HACK\s*:', 'HACK comment in code',
+     (b'hack',)),
+    (rb'app\.run\s*\(.*debug\s*=\s*True', 'Debug mode enabled in production',
+     (b'app.run',)),
+    (rb'FLASK_DEBUG\s*=\s*["\']?1', 'Flask debug mode enabled',
+     (b'flask_debug',)),
+    (rb'verify\s*=\s*False', 'SSL verification disabled',
+     (b'verify',)),
+    (rb'print\s*\(.*password|print\s*\(.*secret|print\s*\(.*token', 'Sensitive data in print()',
+     (b'print',)),
+])
+
+INPUT_VALIDATION_PATTERNS = _compile([
+    (rb'request\.(form|args|data|json)\[', 'Direct request data access without validation',
+     (b'request.',)),
+    (rb'eval\s*\(\s*.*request', 'eval() with user input',
+     (b'eval',)),
+    (rb'exec\s*\(\s*.*request', 'exec() with user input',
+     (b'exec',)),
+    (rb'os\.system\s*\(\s*.*request', 'os.system() with user input — command injection',
+     (b'os.system',)),
+    (rb'subprocess\.\w+\s*\(\s*.*request', 'subprocess with user input — command injection',
+     (b'subprocess.',)),
+])
 
 SEVERITY_MAP = {
     'Hardcoded password': 'HIGH',
@@ -132,21 +211,112 @@ SEVERITY_MAP = {
 }
 
 
+SEVERITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+# Score deduction per finding, indexed like SEVERITY_ORDER
+SEVERITY_WEIGHTS = (20, 10, 5, 2)
+
+# One flat (regex, category, description, severity, literals) table, in scan
+# order, so the per-file loop does no per-category unpacking or map lookups.
+# Strings are interned so every finding shares one copy of each.
+ALL_PATTERNS = [
+    (regex, sys.intern(category), sys.intern(description),
+     sys.intern(SEVERITY_MAP.get(description, 'MEDIUM')), literals)
+    for category, patterns in [
+        ('secrets', SECRET_PATTERNS),
+        ('sql_injection', SQL_INJECTION_PATTERNS),
+        ('unsafe_deserialization', UNSAFE_DESERIALIZE_PATTERNS),
+        ('path_traversal', PATH_TRAVERSAL_PATTERNS),
+        ('insecure_crypto', INSECURE_CRYPTO_PATTERNS),
+        ('debug_leftovers', DEBUG_LEFTOVER_PATTERNS),
+        ('input_validation', INPUT_VALIDATION_PATTERNS),
+    ]
+    for regex, description, literals in patterns
+]
+
+
+# Distinct prefilter literals across all patterns ('.execute', 'request.' ...
+# are shared by several)
+ALL_LITERALS = sorted({literal for *_, literals in ALL_PATTERNS for literal in literals})
+
+
+# Every AST check needs one of these in the (lowered) source: the call names
+# and the substrings tested in assigned and function names. Files without any
+# of them can skip ast.parse, the most expensive step per file.
+AST_TRIGGERS = (
+    b'eval', b'exec', b'__import__', b'subprocess', b'system',
+    b'password', b'secret', b'api_key', b'apikey', b'token', b'private_key',
+    b'auth', b'login',
+)
+
+
+# Per-file findings cache, keyed on (mtime_ns, size). The signature covers the
+# pattern table and regex engine, so changing either invalidates every entry.
+CACHE_FILE = '.devdoc/security_cache.json'
+CACHE_VERSION = 1
+CACHE_SIGNATURE = hashlib.sha1(repr([
+    (type(regex).__module__, regex.pattern, getattr(regex, 'flags', 0), description, severity)
+    for regex, _, description, severity, _ in ALL_PATTERNS
+]).encode()).hexdigest()
+
+
+# Compact record for regex hits; converted to dicts once the scan is merged
+Finding = namedtuple('Finding', 'file line category description severity code')
+
+
 # ─── AST-Based Security Checks ────────────────────────────────────────────────
 
+def _dotted(node: ast.AST) -> Optional[str]:
+    """Return the dotted name of a Name/Attribute chain (``a.b.c``), else None."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return '.'.join(reversed(parts))
+    return None
+
+
+class _ValidationProbe(ast.NodeVisitor):
+    """Look for a Compare or a ``*validate*`` call, stopping at the first one."""
+
+    def __init__(self):
+        self.found = False
+
+    def probe(self, node: ast.AST) -> bool:
+        self.found = False
+        self.visit(node)
+        return self.found
+
+    def visit_Compare(self, node):
+        self.found = True
+
+    def visit_Call(self, node):
+        name = _dotted(node.func)
+        if name and 'validate' in name.lower():
+            self.found = True
+        else:
+            self.generic_visit(node)
+
+    def generic_visit(self, node):
+        if not self.found:
+            super().generic_visit(node)
+
+
 class SecurityASTVisitor(ast.NodeVisitor):
     """AST-level security analysis for deeper pattern detection."""
 
-    def __init__(self, filepath: str, source_lines: list[str]):
+    def __init__(self, filepath: str, source: bytes):
         self.filepath = filepath
-        self.source_lines = source_lines
+        self.source = source
+        self._lines: Optional[list[bytes]] = None  # split on the first finding
         self.findings: list[dict] = []
+        self._probe = _ValidationProbe()
 
     def visit_Call(self, node):
         """Check function calls for security issues."""
-        try:
-            func_name = ast.unparse(node.func)
-        except:
+        func_name = _dotted(node.func)
+        if func_name is None:
             self.generic_visit(node)
             return
 
@@ -162,7 +332,7 @@ class SecurityASTVisitor(ast.NodeVisitor):
                 })
 
         # subprocess.call/run with shell=True
-        if 'subprocess' in func_name:
+        if 'subprocess' in func_name.split('.'):
             for kw in node.keywords:
                 if kw.arg == 'shell' and isinstance(kw.value, ast.Constant) and kw.value.value is True:
                     self.findings.append({
@@ -212,19 +382,7 @@ class SecurityASTVisitor(ast.NodeVisitor):
         name_lower = node.name.lower()
         if any(s in name_lower for s in ('password', 'auth', 'login', 'token')):
             # Check if function validates input length/format
-            has_validation = False
-            for child in ast.walk(node):
-                if isinstance(child, ast.Compare):
-                    has_validation = True
-                    break
-                if isinstance(child, ast.Call):
-                    try:
-                        if 'validate' in ast.unparse(child.func).lower():
-                            has_validation = True
-                            break
-                    except:
-                        pass
-            if not has_validation:
+            if not self._probe.probe(node):
                 self.findings.append({
                     'type': 'missing_validation',
                     'description': f'Security-sensitive function "{node.name}" may lack input validation',
@@ -235,13 +393,132 @@ class SecurityASTVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
     def _get_line(self, lineno: int) -> str:
-        if 1 <= lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()[:120]
+        if self._lines is None:
+            self._lines = self.source.split(b'\n')
+        if 1 <= lineno <= len(self._lines):
+            return self._lines[lineno - 1].decode('utf-8', 'ignore').strip()[:120]
         return ""
 
 
 # ─── Scanner ───────────────────────────────────────────────────────────────────
 
+# Below this many files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def _read_source(fpath: Path) -> bytes:
+    """Read a source file as raw bytes, normalizing newlines like text mode."""
+    with open(fpath, 'rb') as f:
+        source = f.read()
+    if b'\r' in source:
+        source = source.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return source
+
+
+def _literal_lines(haystack: bytes, literal: bytes, bounds: dict) -> list[int]:
+    """Return sorted 0-based indexes of lines containing ``literal``.
+
+    The literal is located with bytes.find over the whole buffer rather than
+    line by line; line indexes come from counting newlines between hits.
+    Each hit line's (start, end) offsets are recorded in ``bounds``.
+    """
+    line_indexes = []
+    line = prev = 0
+    pos = haystack.find(literal)
+    while pos != -1:
+        line += haystack.count(b'\n', prev, pos)
+        line_indexes.append(line)
+        start = haystack.rfind(b'\n', prev, pos) + 1
+        # One hit per line is enough; resume at the next line
+        prev = haystack.find(b'\n', pos)
+        if line not in bounds:
+            bounds[line] = (start, prev if prev != -1 else len(haystack))
+        if prev == -1:
+            break
+        pos = haystack.find(literal, prev)
+    return line_indexes
+
+
+def _scan_file(rel_path: str, abs_path: str, one_per_category: bool = False) -> list:
+    """Regex + AST scan of one file, as Finding tuples and AST finding dicts.
+
+    Module level (no ``self``) so it can run in a worker process; the
+    compiled pattern tables are module globals built on import. With
+    ``one_per_category``, a line reports at most one regex finding per
+    category: the first matching pattern, in table order.
+    """
+    try:
+        source = _read_source(Path(abs_path))
+        lowered = source.lower()  # ASCII-only, so offsets match ``source``
+    except:
+        return []
+
+    findings = []
+
+    # Regex-based scanning. Fused prefilter: each distinct literal is looked
+    # up once per file, and patterns whose literals are all absent cost nothing.
+    # Only lines with a literal hit are ever sliced out of the source.
+    bounds = {}  # line index -> (start, end) offsets
+    literal_hits = {literal: _literal_lines(lowered, literal, bounds) for literal in ALL_LITERALS}
+    hit_lines = {}  # line index -> (line, stripped), shared across patterns
+    matched = set() if one_per_category else None  # (line index, category)
+    for regex, category, description, severity, literals in ALL_PATTERNS:
+        if len(literals) == 1:
+            candidates = literal_hits[literals[0]]
+        else:
+            candidates = sorted(set().union(*(literal_hits[lit] for lit in literals)))
+        for i in candidates:
+            if matched is not None and (i, category) in matched:
+                continue
+            cached = hit_lines.get(i)
+            if cached is None:
+                start, end = bounds[i]
+                line = source[start:end]
+                cached = hit_lines[i] = (line, line.strip())
+            line, stripped = cached
+            # Skip comments and docstrings (basic filter) before any regex work
+            if stripped.startswith(b'#'):
+                continue
+            if regex.search(line):
+                findings.append(Finding(
+                    rel_path, i + 1, category, description, severity,
+                    line.decode('utf-8', 'ignore').strip()[:120],
+                ))
+                if matched is not None:
+                    matched.add((i, category))
+
+    # AST-based scanning. Non-ASCII sources are always parsed: identifiers
+    # are NFKC-normalized, so a trigger may be spelled with other code points.
+    if source.isascii() and not any(trigger in lowered for trigger in AST_TRIGGERS):
+        return findings
+    try:
+        visitor = SecurityASTVisitor(rel_path, source)
+        # ast.parse takes bytes directly and honors any coding declaration.
+        # Bytes that do not decode are a SyntaxError there; retry on text
+        # with them dropped, as the scanner did when it decoded up front.
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            tree = ast.parse(source.decode('utf-8', 'ignore'))
+        visitor.visit(tree)
+        # Deduplicate online (same line + description; the file is fixed).
+        # Regex findings never collide: each pattern visits a line at most
+        # once and descriptions are distinct, so only AST hits are checked.
+        seen = set()
+        for finding in visitor.findings:
+            key = (finding['line'], finding['description'])
+            if key in seen:
+                continue
+            seen.add(key)
+            finding['file'] = rel_path
+            finding['category'] = finding.get('type', 'ast_check')
+            findings.append(finding)
+    except (SyntaxError, ValueError):  # ValueError: NUL bytes in source
+        pass
+
+    return findings
+
+
 class SecurityScanner:
     """Full security scan combining regex patterns + AST analysis."""
 
@@ -252,102 +529,138 @@ class SecurityScanner:
             'node_modules', '.git', '__pycache__', '.venv', 'venv',
             'dist', 'build', '.next', 'coverage', '.devdoc',
         }
+        self.one_per_category = self.config.get('one_per_category', False)
+        self.use_cache = self.config.get('cache', True)
+        # Findings differ per mode, so each mode has its own cache signature
+        self._cache_signature = CACHE_SIGNATURE + ('-one-per-category' if self.one_per_category else '')
+        self.cache_path = self.root / CACHE_FILE
+        self._cache = self._load_cache() if self.use_cache else {}
 
     def scan(self, file_analyses: Optional[list] = None) -> dict:
         """Run security scan across the project."""
-        findings = []
-        files_scanned = 0
-
-        for dirpath, dirnames, filenames in os.walk(self.root):
-            dirnames[:] = [d for d in dirnames if d not in self.skip_dirs]
-
-            for fname in filenames:
-                if not fname.endswith('.py'):
-                    continue
-
-                fpath = Path(dirpath) / fname
-                rel_path = str(fpath.relative_to(self.root))
-                files_scanned += 1
-
-                try:
-                    with open(fpath, 'r', encoding='utf-8', errors='ignore') as f:
-                        source = f.read()
-                    lines = source.split('\n')
-                except:
-                    continue
-
-                # Regex-based scanning
-                for pattern_group, patterns in [
-                    ('secrets', SECRET_PATTERNS),
-                    ('sql_injection', SQL_INJECTION_PATTERNS),
-                    ('unsafe_deserialization', UNSAFE_DESERIALIZE_PATTERNS),
-                    ('path_traversal', PATH_TRAVERSAL_PATTERNS),
-                    ('insecure_crypto', INSECURE_CRYPTO_PATTERNS),
-                    ('debug_leftovers', DEBUG_LEFTOVER_PATTERNS),
-                    ('input_validation', INPUT_VALIDATION_PATTERNS),
-                ]:
-                    for regex, description in patterns:
-                        for i, line in enumerate(lines, 1):
-                            if re.search(regex, line):
-                                # Skip comments and docstrings (basic filter)
-                                stripped = line.strip()
-                                if stripped.startswith('#'):
-                                    continue
-                                findings.append({
-                                    'file': rel_path,
-                                    'line': i,
-                                    'category': pattern_group,
-                                    'description': description,
-                                    'severity': SEVERITY_MAP.get(description, 'MEDIUM'),
-                                    'code': stripped[:120],
-                                })
-
-                # AST-based scanning
-                try:
-                    visitor = SecurityASTVisitor(rel_path, lines)
-                    tree = ast.parse(source)
-                    visitor.visit(tree)
-                    for finding in visitor.findings:
-                        finding['file'] = rel_path
-                        finding['category'] = finding.get('type', 'ast_check')
-                        findings.append(finding)
-                except SyntaxError:
-                    pass
-
-        # Deduplicate findings (same file + line + description)
-        seen = set()
-        unique_findings = []
-        for f in findings:
-            key = (f['file'], f['line'], f['description'])
-            if key not in seen:
-                seen.add(key)
-                unique_findings.append(f)
+        paths = self._collect_files()
+
+        # Reuse cached findings for files whose mtime and size are unchanged
+        per_file = [None] * len(paths)
+        stats = [None] * len(paths)
+        misses = []
+        for idx, (rel_path, abs_path) in enumerate(paths):
+            try:
+                st = os.stat(abs_path)
+            except OSError:
+                misses.append(idx)
+                continue
+            stats[idx] = (st.st_mtime_ns, st.st_size)
+            entry = self._cache.get(rel_path)
+            if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                per_file[idx] = entry['findings']
+            else:
+                misses.append(idx)
+        scanned = self._map_files([paths[idx] for idx in misses])
+        for idx, file_findings in zip(misses, scanned):
+            per_file[idx] = [
+                f._asdict() if type(f) is Finding else f for f in file_findings
+            ]
+
+        if self.use_cache:
+            self._save_cache({
+                rel_path: {'mtime_ns': stat[0], 'size': stat[1], 'findings': file_findings}
+                for (rel_path, _), stat, file_findings in zip(paths, stats, per_file)
+                if stat is not None
+            })
+
+        # Each file's findings arrive already deduplicated by _scan_file
+        findings = [f for file_findings in per_file for f in file_findings]
+        files_scanned = len(paths)
 
         # Score
-        severity_counts = {'CRITICAL': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
-        for f in unique_findings:
-            severity_counts[f.get('severity', 'MEDIUM')] += 1
+        # counts[4] collects unknown severities, which neither count nor score
+        counts = [0] * 5
+        for f in findings:
+            counts[SEVERITY_ORDER.get(f.get('severity', 'MEDIUM'), 4)] += 1
+        severity_counts = dict(zip(SEVERITY_ORDER, counts))
+        findings.sort(key=lambda f: SEVERITY_ORDER.get(f.get('severity', 'MEDIUM'), 4))
 
         # Security score: start at 100, deduct per finding
-        score = 100
-        score -= severity_counts['CRITICAL'] * 20
-        score -= severity_counts['HIGH'] * 10
-        score -= severity_counts['MEDIUM'] * 5
-        score -= severity_counts['LOW'] * 2
-        score = max(0, score)
+        score = max(0, 100 - sum(c * w for c, w in zip(counts, SEVERITY_WEIGHTS)))
 
         return {
             'files_scanned': files_scanned,
-            'total_findings': len(unique_findings),
+            'total_findings': len(findings),
             'severity_counts': severity_counts,
             'security_score': score,
             'security_grade': self._score_to_grade(score),
-            'findings': sorted(unique_findings, key=lambda f:
-                {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}.get(f.get('severity', 'MEDIUM'), 4)
-            ),
-            'summary': self._build_summary(unique_findings, severity_counts),
+            'findings': findings,
+            'summary': self._build_summary(findings, severity_counts),
         }
 
+    def _load_cache(self) -> dict:
+        """Load the per-file findings cache; empty if missing, stale or unreadable."""
+        try:
+            with open(self.cache_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (not isinstance(data, dict) or data.get('version') != CACHE_VERSION
+                or data.get('signature') != self._cache_signature):
+            return {}
+        files = data.get('files')
+        return files if isinstance(files, dict) else {}
+
+    def _save_cache(self, files: dict):
+        """Write the cache atomically; a read-only project just goes uncached."""
+        data = {'version': CACHE_VERSION, 'signature': self._cache_signature, 'files': files}
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _collect_files(self) -> list[tuple[str, str]]:
+        """List (rel_path, abs_path) for every .py file, in os.walk order.
+
+        A scandir stack classifies entries from the directory listing itself
+        instead of os.walk's per-directory lists and extra stats.
+        """
+        root = str(self.root)
+        prefix_len = len(os.path.join(root, ''))
+        paths = []
+        stack = [root]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like os.walk: symlinked dirs aren't followed
+                            if entry.name not in self.skip_dirs and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith('.py'):
+                            paths.append((entry.path[prefix_len:], entry.path))
+            except OSError:
+                continue
+            # Reversed so subdirectories are popped in listing order
+            stack.extend(reversed(subdirs))
+        return paths
+
+    def _map_files(self, paths: list[tuple[str, str]]) -> list[list]:
+        """Scan (rel_path, abs_path) pairs, in worker processes when worthwhile.
+
+        Results come back in ``paths`` order, so output matches a serial scan.
+        """
+        scan_file = functools.partial(_scan_file, one_per_category=self.one_per_category)
+        workers = self.config.get('workers') or os.cpu_count() or 1
+        if workers > 1 and len(paths) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(scan_file, *zip(*paths), chunksize=16))
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                pass  # no usable process pool here; scan in-process instead
+        return [scan_file(rel_path, abs_path) for rel_path, abs_path in paths]
+
     def _score_to_grade(self, score: int) -> str:
         if score >= 90: return 'A'
         if score >= 75: return 'B'
@@ -379,9 +692,16 @@ def main():
     parser = argparse.ArgumentParser(description='DevDoc Security Scanner')
     parser.add_argument('project_path', help='Path to project root')
     parser.add_argument('--output', '-o', help='Output JSON file path')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Rescan every file, ignoring and not writing {CACHE_FILE}')
+    parser.add_argument('--one-per-category', action='store_true',
+                        help='Report at most one regex finding per category on each line')
     args = parser.parse_args()
 
-    scanner = SecurityScanner(args.project_path)
+    scanner = SecurityScanner(args.project_path, {
+        'cache': not args.no_cache,
+        'one_per_category': args.one_per_category,
+    })
     results = scanner.scan()
 
     output = json.dumps(results, indent=2, default=str)
@@ -4,6 +4,10 @@ DevDoc Snapshot Manager
 
 Stores, loads, and diffs historical analysis snapshots for trend tracking:
 - Save analysis results with timestamps to .devdoc/snapshots/
+- Keep a metadata index (index.json) so listing never parses whole snapshots
+  and trends read precomputed per-snapshot rows
+- Store each distinct analysis once under blobs/, named by its content hash;
+  snapshot files point at their blob; prune deletes blobs no snapshot uses
 - Load previous snapshots for comparison
 - Compute diffs between any two snapshots
 - Detect regressions (metric degradation beyond threshold)
@@ -14,71 +18,311 @@ Usage:
     python snapshot_manager.py diff [--last 2] [--project-dir .]
     python snapshot_manager.py trend [--project-dir .]
     python snapshot_manager.py list [--project-dir .]
+    python snapshot_manager.py prune [--project-dir .]
 
 Part of the codebase-analyzer WithAI ability.
 """
 
 import os
+import re
 import sys
 import json
 import argparse
 import hashlib
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup for reading; stdlib json is the fallback
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional; without it snapshots are stored as plain JSON
+    zstandard = None
+
 
 DEFAULT_SNAPSHOT_DIR = '.devdoc/snapshots'
+INDEX_FILENAME = 'index.json'  # metadata of every snapshot, kept in sync by save()
+SNAPSHOT_SUFFIXES = ('.json', '.json.zst')
+BLOB_DIRNAME = 'blobs'  # content-addressed analysis payloads, shared by snapshots
+ZSTD_LEVEL = 3
+# Index reconciles reading at least this many files overlap the reads in threads
+PARALLEL_READ_MIN = 8
+PARALLEL_READ_WORKERS = 16
 REGRESSION_THRESHOLD = 0.10  # 10% degradation triggers alert
 
+# metric -> (direction that is a regression, % change above which it is HIGH,
+# % change above which it is reported at all)
+REGRESSION_RULES = {
+    # Complexity increasing is bad
+    'avg_complexity': ('increased', 25, REGRESSION_THRESHOLD * 100),
+    'max_complexity': ('increased', 25, REGRESSION_THRESHOLD * 100),
+    'median_complexity': ('increased', 25, REGRESSION_THRESHOLD * 100),
+    'avg_function_length': ('increased', 25, REGRESSION_THRESHOLD * 100),
+    'max_function_length': ('increased', 25, REGRESSION_THRESHOLD * 100),
+    # Coverage decreasing is bad
+    'docstring_coverage': ('decreased', 20, REGRESSION_THRESHOLD * 100),
+    'type_hint_coverage': ('decreased', 20, REGRESSION_THRESHOLD * 100),
+}
+
+
+def _dump_json(obj, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes.
+
+    Always stdlib json, never orjson: saved analyses are hashed, and orjson
+    spells non-ASCII text, floats and NaN differently, so the same analysis
+    would hash (and be stored) differently depending on what is installed.
+    """
+    return json.dumps(obj, sort_keys=sort_keys, separators=(',', ':'), default=str).encode()
+
+
+def _read_file(path) -> bytes:
+    """Read a file's bytes, decompressing ``.zst`` files."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if str(path).endswith('.zst'):
+        if zstandard is None:
+            raise OSError(f'zstandard is required to read {path}')
+        # decompressobj handles frames written without a content size
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+def _load_json(path) -> dict:
+    """Parse a (possibly zstd-compressed) JSON file, using orjson when installed."""
+    return _parse_json(_read_file(path))
+
+
+def _parse_json(data: bytes) -> dict:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity tokens, which only stdlib json reads
+    return json.loads(data)
+
+
+# Snapshots are always written with snapshot_metadata as the first key
+_METADATA_PREFIX = re.compile(rb'\{\s*"snapshot_metadata"\s*:\s*')
+_METADATA_HEAD_BYTES = 64 * 1024
+
+
+def _read_metadata(path) -> dict:
+    """Return a snapshot's metadata without parsing its analysis payload.
+
+    Decodes just the leading snapshot_metadata object from the head of the
+    file; falls back to a full parse when the head doesn't hold all of it.
+    """
+    data = None
+    if str(path).endswith('.zst'):
+        data = _read_file(path)  # decompressing the whole frame is cheap
+        head = data[:_METADATA_HEAD_BYTES]
+    else:
+        with open(path, 'rb') as f:
+            head = f.read(_METADATA_HEAD_BYTES)
+    match = _METADATA_PREFIX.match(head)
+    if match:
+        try:
+            # A multi-byte character cut at the end of the head only affects
+            # bytes after the metadata object
+            text = head.decode('utf-8', 'ignore')
+            meta, _ = json.JSONDecoder().raw_decode(text, match.end())
+            if isinstance(meta, dict):
+                return meta
+        except ValueError:
+            pass
+    return _parse_json(data if data is not None else _read_file(path)).get('snapshot_metadata', {})
+
+
+def _write_atomic(path: Path, parts, durable: bool = False):
+    """Write ``parts`` to a temp file beside ``path``, then rename it over ``path``.
+
+    Readers see either the old file or the complete new one, never a partial
+    write. ``durable`` adds an fsync before the rename.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.writelines(parts)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _index_entry(path: str, size_bytes: int) -> Optional[dict]:
+    """Build a snapshot's index entry from its file; None if it is unreadable."""
+    try:
+        return dict(_read_metadata(path), size_bytes=size_bytes)
+    # AttributeError: valid JSON that isn't a snapshot object
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_snapshot(filepath: str) -> dict:
+    """Parse a snapshot file, once per process per path.
+
+    Snapshot files are never modified after save(), so repeated loads (e.g.
+    diffing 0-1 then 1-2) share one parsed copy; callers must not mutate it.
+    A pointer snapshot ({'snapshot_metadata', 'blob'}) is resolved to the
+    usual {'snapshot_metadata', 'analysis'} shape; blobs are cached too, so
+    snapshots sharing one are parsed once. A missing or unreadable blob
+    raises OSError naming the snapshot.
+    """
+    data = _load_json(filepath)
+    blob = _blob_name(data)
+    if blob is not None:
+        try:
+            analysis = _load_snapshot(os.path.join(os.path.dirname(filepath), blob))
+        except (OSError, ValueError) as e:
+            raise OSError(f"{os.path.basename(filepath)} points at unreadable blob {blob}: {e}") from e
+        return {'snapshot_metadata': data['snapshot_metadata'], 'analysis': analysis}
+    return data
+
+
+def _blob_name(data) -> Optional[str]:
+    """The blob a parsed pointer snapshot refers to; None for any other document."""
+    if isinstance(data, dict) and 'blob' in data and 'analysis' not in data and 'snapshot_metadata' in data:
+        return data['blob']
+    return None
+
+
+# Values trend() plots, from project_metrics and summary respectively
+TREND_METRIC_KEYS = ('avg_complexity', 'max_complexity', 'docstring_coverage',
+                     'type_hint_coverage', 'total_functions')
+TREND_SUMMARY_KEYS = ('total_lines', 'total_files')
+# Values whose start-to-end change trend() reports
+TREND_CHANGE_KEYS = ('avg_complexity', 'max_complexity', 'docstring_coverage',
+                     'type_hint_coverage', 'total_functions', 'total_lines')
+_trend_change_values = operator.itemgetter(*TREND_CHANGE_KEYS)
+
+
+def _trend_row(analysis: dict) -> dict:
+    """The per-snapshot values trend() plots, kept in the index by save().
+
+    Missing values default to 0 here, once, so every row has every key.
+    """
+    metrics = analysis.get('project_metrics', {})
+    summary = analysis.get('summary', {})
+    row = {key: metrics.get(key, 0) for key in TREND_METRIC_KEYS}
+    row.update((key, summary.get(key, 0)) for key in TREND_SUMMARY_KEYS)
+    return row
+
+
+def _file_metrics(analysis: dict) -> dict:
+    """Map filepath -> file analysis for every file analyzed without error."""
+    return {fa['filepath']: fa for fa in analysis.get('file_analyses', []) if 'error' not in fa}
+
+
+def _round_diff(result: dict) -> dict:
+    """Return a copy of a diff() result with its changes rounded for output."""
+    return dict(
+        result,
+        metric_changes={
+            metric: dict(row, change=round(row['change'], 4), pct_change=round(row['pct_change'], 2))
+            for metric, row in result['metric_changes'].items()
+        },
+        file_complexity_changes=[
+            dict(row, change=round(row['change'], 2)) for row in result['file_complexity_changes']
+        ],
+    )
+
 
 class SnapshotManager:
     """Manage historical analysis snapshots for continuous intelligence."""
 
-    def __init__(self, project_dir: str, snapshot_dir: Optional[str] = None):
+    def __init__(self, project_dir: str, snapshot_dir: Optional[str] = None, durable: bool = False):
         self.project_dir = Path(project_dir).resolve()
+        self.durable = durable  # fsync snapshot and index writes
         self.snapshot_dir = self.project_dir / (snapshot_dir or DEFAULT_SNAPSHOT_DIR)
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.snapshot_dir / INDEX_FILENAME
+        self._index: Optional[dict] = None  # filename -> metadata, loaded lazily
 
     def save(self, analysis: dict, label: Optional[str] = None) -> str:
-        """Save an analysis snapshot. Returns the snapshot filename."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        content_hash = hashlib.md5(
-            json.dumps(analysis, sort_keys=True, default=str).encode()
-        ).hexdigest()[:8]
+        """Save an analysis snapshot. Returns the snapshot filename.
+
+        Saving the same analysis and label as the most recent snapshot writes
+        nothing and returns that snapshot's filename.
+        """
+        # One clock read, so the filename and metadata times always agree
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        # Serialized once: the canonical bytes are both hashed and written
+        payload = _dump_json(analysis, sort_keys=True)
+        full_hash = hashlib.sha256(payload).hexdigest()
+        content_hash = full_hash[:8]
+
+        # Only the latest snapshot counts: re-saving an older state (A, B, A)
+        # must still record the return to it
+        index = self._get_index()
+        latest = max((name for name, entry in index.items() if entry is not None), default=None)
+        if latest is not None:
+            entry = index[latest]
+            if entry.get('content_hash') == content_hash and entry.get('label') == label:
+                return latest
+
+        # The analysis goes into a blob named by its full hash, written only
+        # if no earlier snapshot stored the same content in a readable form
+        readable = ('.json.zst', '.json') if zstandard is not None else ('.json',)
+        blob_names = [f"{BLOB_DIRNAME}/{full_hash}{suffix}" for suffix in readable]
+        blob_name = next((name for name in blob_names if (self.snapshot_dir / name).exists()), None)
+        if blob_name is None:
+            blob_name = blob_names[0]
+            blob_path = self.snapshot_dir / blob_name
+            blob = [payload]
+            if blob_name.endswith('.zst'):
+                compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+                blob = [compressor.compress(payload), compressor.flush()]
+            blob_path.parent.mkdir(exist_ok=True)
+            _write_atomic(blob_path, blob, self.durable)
 
         label_part = f"_{label}" if label else ""
         filename = f"snapshot_{timestamp}{label_part}_{content_hash}.json"
         filepath = self.snapshot_dir / filename
 
-        snapshot = {
-            'snapshot_metadata': {
-                'timestamp': datetime.now().isoformat(),
-                'label': label,
-                'content_hash': content_hash,
-                'filename': filename,
-            },
-            'analysis': analysis,
+        metadata = {
+            'timestamp': now.isoformat(),
+            'label': label,
+            'content_hash': content_hash,
+            'filename': filename,
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(snapshot, f, indent=2, default=str)
+        # A small pointer file; loading resolves it to the analysis in the blob
+        document = [_dump_json({'snapshot_metadata': metadata, 'blob': blob_name})]
+        _write_atomic(filepath, document, self.durable)
+        _load_snapshot.cache_clear()  # in case an identical filename was rewritten
+
+        index[filename] = dict(metadata, size_bytes=sum(map(len, document)), trend_row=_trend_row(analysis))
+        self._write_index(index)
 
         return filename
 
     def list_snapshots(self) -> list[dict]:
         """List all available snapshots, sorted by timestamp (newest first)."""
         snapshots = []
-        for fpath in sorted(self.snapshot_dir.glob('snapshot_*.json'), reverse=True):
-            try:
-                with open(fpath, 'r') as f:
-                    data = json.load(f)
-                meta = data.get('snapshot_metadata', {})
-                meta['filepath'] = str(fpath)
-                meta['size_bytes'] = fpath.stat().st_size
-                snapshots.append(meta)
-            except:
-                pass
+        for filename, entry in sorted(self._get_index().items(), reverse=True):
+            if entry is None:
+                continue  # unreadable snapshot file
+            meta = dict(entry)
+            meta.pop('trend_row', None)
+            size_bytes = meta.pop('size_bytes')
+            meta['filepath'] = str(self.snapshot_dir / filename)
+            meta['size_bytes'] = size_bytes
+            snapshots.append(meta)
         return snapshots
 
     def load(self, index: int = 0) -> Optional[dict]:
@@ -86,12 +330,88 @@ class SnapshotManager:
         snapshots = self.list_snapshots()
         if index >= len(snapshots):
             return None
-        filepath = snapshots[index]['filepath']
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return self._load_file(snapshots[index]['filepath'])
+
+    def _load_file(self, filepath: str) -> dict:
+        return _load_snapshot(str(filepath))
+
+    # ─── Index ─────────────────────────────────────────────────────────────
+
+    def _get_index(self) -> dict:
+        """Return the snapshot index, reading or reconciling it on first use.
+
+        The index on disk is trusted as is while it names exactly the snapshot
+        files present. Otherwise (snapshots copied in or deleted by hand, or
+        no usable index) it is reconciled against the directory.
+        """
+        if self._index is not None:
+            return self._index
+        on_disk = self._scan_snapshot_files()
+        try:
+            index = _load_json(self._index_path)
+        except (OSError, ValueError):
+            index = None
+        if not isinstance(index, dict):
+            index = {}
+        if index.keys() != on_disk.keys():
+            index = self._reconcile_index(index, on_disk)
+            self._write_index(index)
+        self._index = index
+        return index
+
+    def _scan_snapshot_files(self) -> dict:
+        """Map each snapshot filename to its DirEntry, from one directory read."""
+        with os.scandir(self.snapshot_dir) as entries:
+            return {
+                entry.name: entry for entry in entries
+                if entry.name.startswith('snapshot_') and entry.name.endswith(SNAPSHOT_SUFFIXES)
+                and entry.is_file()
+            }
+
+    def _reconcile_index(self, index: dict, on_disk: dict) -> dict:
+        """Index exactly the files in ``on_disk``, reusing entries whose size matches.
+
+        Only new or changed files are read (in threads when there are many, so
+        cold reads overlap); unreadable files map to None.
+        """
+        reconciled = {}
+        to_read = []  # (name, path, size_bytes)
+        for name, entry in on_disk.items():
+            try:
+                size_bytes = entry.stat().st_size
+            except OSError:
+                reconciled[name] = None
+                continue
+            known = index.get(name)
+            if isinstance(known, dict) and known.get('size_bytes') == size_bytes:
+                reconciled[name] = known
+            else:
+                reconciled[name] = None
+                to_read.append((name, entry.path, size_bytes))
+
+        if to_read:
+            names, paths, sizes = zip(*to_read)
+            if len(to_read) >= PARALLEL_READ_MIN:
+                with ThreadPoolExecutor(max_workers=min(PARALLEL_READ_WORKERS, len(to_read))) as executor:
+                    entries = list(executor.map(_index_entry, paths, sizes))
+            else:
+                entries = list(map(_index_entry, paths, sizes))
+            reconciled.update(zip(names, entries))
+        return reconciled
+
+    def _write_index(self, index: dict):
+        """Atomically replace the index file; failing to write it is not fatal."""
+        self._index = index
+        try:
+            _write_atomic(self._index_path, [_dump_json(index)], self.durable)
+        except OSError:
+            pass
 
     def diff(self, older_index: int = 1, newer_index: int = 0) -> Optional[dict]:
-        """Compare two snapshots and return a structured diff."""
+        """Compare two snapshots and return a structured diff.
+
+        Changes are kept at full precision; _round_diff rounds them for output.
+        """
         older = self.load(older_index)
         newer = self.load(newer_index)
 
@@ -136,28 +456,24 @@ class SnapshotManager:
             metric_changes[metric] = {
                 'old': old_val,
                 'new': new_val,
-                'change': round(change, 4),
-                'pct_change': round(pct_change, 2),
+                'change': change,
+                'pct_change': pct_change,
                 'direction': direction,
             }
 
             # Check for regressions
-            # Complexity increasing is bad
-            if metric in ('avg_complexity', 'max_complexity', 'median_complexity',
-                         'avg_function_length', 'max_function_length'):
-                if pct_change > REGRESSION_THRESHOLD * 100:
-                    regressions.append({
-                        'metric': metric,
-                        'severity': 'HIGH' if pct_change > 25 else 'MEDIUM',
-                        'message': f'{metric} increased by {pct_change:.1f}% ({old_val} → {new_val})',
-                    })
-            # Coverage decreasing is bad
-            elif metric in ('docstring_coverage', 'type_hint_coverage'):
-                if change < 0 and abs(pct_change) > REGRESSION_THRESHOLD * 100:
+            rule = REGRESSION_RULES.get(metric)
+            if rule:
+                worse, high_pct, alert_pct = rule
+                if worse == 'increased':
+                    magnitude = pct_change
+                else:
+                    magnitude = abs(pct_change) if change < 0 else 0
+                if magnitude > alert_pct:
                     regressions.append({
                         'metric': metric,
-                        'severity': 'HIGH' if abs(pct_change) > 20 else 'MEDIUM',
-                        'message': f'{metric} decreased by {abs(pct_change):.1f}% ({old_val} → {new_val})',
+                        'severity': 'HIGH' if magnitude > high_pct else 'MEDIUM',
+                        'message': f'{metric} {worse} by {magnitude:.1f}% ({old_val} → {new_val})',
                     })
 
         # Compare summary stats
@@ -176,34 +492,38 @@ class SnapshotManager:
                 }
 
         # File-level changes
-        old_files = {fa['filepath'] for fa in older_analysis.get('file_analyses', []) if 'error' not in fa}
-        new_files = {fa['filepath'] for fa in newer_analysis.get('file_analyses', []) if 'error' not in fa}
-
-        added_files = sorted(new_files - old_files)
-        removed_files = sorted(old_files - new_files)
-
-        # Per-file complexity changes
-        old_file_metrics = {
-            fa['filepath']: fa for fa in older_analysis.get('file_analyses', []) if 'error' not in fa
-        }
-        new_file_metrics = {
-            fa['filepath']: fa for fa in newer_analysis.get('file_analyses', []) if 'error' not in fa
-        }
-
-        file_changes = []
-        for fp in sorted(old_files & new_files):
-            old_fa = old_file_metrics[fp]
-            new_fa = new_file_metrics[fp]
+        old_file_metrics = _file_metrics(older_analysis)
+        new_file_metrics = _file_metrics(newer_analysis)
+
+        # One pass over the newer files classifies each as added or common;
+        # common files with a complexity change become (file, old, new,
+        # change) tuples, and dicts are built just for those rows
+        added_files = []
+        changed = []
+        for fp, new_fa in new_file_metrics.items():
+            old_fa = old_file_metrics.get(fp)
+            if old_fa is None:
+                added_files.append(fp)
+                continue
             old_cx = old_fa.get('avg_complexity', 0)
             new_cx = new_fa.get('avg_complexity', 0)
             if old_cx != new_cx:
-                file_changes.append({
-                    'file': fp,
-                    'old_complexity': old_cx,
-                    'new_complexity': new_cx,
-                    'change': round(new_cx - old_cx, 2),
-                    'direction': 'worse' if new_cx > old_cx else 'better',
-                })
+                changed.append((fp, old_cx, new_cx, new_cx - old_cx))
+        added_files.sort()
+        removed_files = sorted(fp for fp in old_file_metrics if fp not in new_file_metrics)
+        # Largest change first, compared at displayed precision so float noise
+        # (2.44 - 2.43 vs 2.68 - 2.67) doesn't reorder ties; ties stay in file order
+        changed.sort(key=lambda row: (-round(abs(row[3]), 2), row[0]))
+        file_changes = [
+            {
+                'file': fp,
+                'old_complexity': old_cx,
+                'new_complexity': new_cx,
+                'change': change,
+                'direction': 'worse' if new_cx > old_cx else 'better',
+            }
+            for fp, old_cx, new_cx, change in changed
+        ]
 
         return {
             'comparison': {
@@ -216,7 +536,7 @@ class SnapshotManager:
             'regression_detected': len(regressions) > 0,
             'added_files': added_files,
             'removed_files': removed_files,
-            'file_complexity_changes': sorted(file_changes, key=lambda x: abs(x['change']), reverse=True),
+            'file_complexity_changes': file_changes,
         }
 
     def trend(self, max_snapshots: int = 20) -> dict:
@@ -229,37 +549,36 @@ class SnapshotManager:
                 'data_points': [],
             }
 
+        # Rows come from the index; snapshots indexed by a rebuild (no row yet)
+        # are loaded once and their rows persisted for later runs
+        index = self._get_index()
+        missing_rows = False
         data_points = []
-        for i, snap_meta in enumerate(reversed(snapshots)):  # Oldest first
-            snap = self.load(len(snapshots) - 1 - i)
-            if not snap:
-                continue
-
-            analysis = snap['analysis']
-            metrics = analysis.get('project_metrics', {})
-            summary = analysis.get('summary', {})
+        for snap_meta in reversed(snapshots):  # Oldest first
+            entry = index[os.path.basename(snap_meta['filepath'])]
+            row = entry.get('trend_row')
+            if row is None:
+                try:
+                    analysis = self._load_file(snap_meta['filepath'])['analysis']
+                except (OSError, ValueError):
+                    continue  # e.g. its blob was deleted; skip it like an unreadable snapshot
+                row = entry['trend_row'] = _trend_row(analysis)
+                missing_rows = True
 
             data_points.append({
                 'timestamp': snap_meta.get('timestamp', ''),
                 'label': snap_meta.get('label', ''),
-                'avg_complexity': metrics.get('avg_complexity', 0),
-                'max_complexity': metrics.get('max_complexity', 0),
-                'docstring_coverage': metrics.get('docstring_coverage', 0),
-                'type_hint_coverage': metrics.get('type_hint_coverage', 0),
-                'total_functions': metrics.get('total_functions', 0),
-                'total_lines': summary.get('total_lines', 0),
-                'total_files': summary.get('total_files', 0),
+                **row,
             })
+        if missing_rows:
+            self._write_index(index)
 
         # Compute trends (direction over time)
         if len(data_points) >= 2:
             first = data_points[0]
             last = data_points[-1]
             trends = {}
-            for key in ['avg_complexity', 'max_complexity', 'docstring_coverage',
-                       'type_hint_coverage', 'total_functions', 'total_lines']:
-                old = first.get(key, 0)
-                new = last.get(key, 0)
+            for key, old, new in zip(TREND_CHANGE_KEYS, _trend_change_values(first), _trend_change_values(last)):
                 if old != 0:
                     pct = round((new - old) / old * 100, 1)
                 else:
@@ -282,40 +601,100 @@ class SnapshotManager:
             'data_points': data_points,
         }
 
+    def prune(self) -> list[str]:
+        """Delete blobs that no snapshot points at. Returns the deleted blob names.
+
+        Deleting snapshot files frees little by itself, since their analyses
+        live on in blobs/. Nothing is deleted if any snapshot can't be read,
+        as its blob can't be told apart from an unused one.
+        """
+        blob_dir = self.snapshot_dir / BLOB_DIRNAME
+        if not blob_dir.is_dir():
+            return []
+        in_use = set()
+        for name in self._scan_snapshot_files():
+            try:
+                blob = _blob_name(_load_json(self.snapshot_dir / name))
+            except (OSError, ValueError) as e:
+                raise OSError(f"cannot read {name}, so no blobs were pruned: {e}") from e
+            if blob is not None:
+                in_use.add(blob)
+        removed = []
+        with os.scandir(blob_dir) as entries:
+            for entry in entries:
+                name = f"{BLOB_DIRNAME}/{entry.name}"
+                if entry.name.endswith(SNAPSHOT_SUFFIXES) and name not in in_use:
+                    os.unlink(entry.path)
+                    removed.append(name)
+        if removed:
+            _load_snapshot.cache_clear()
+        return sorted(removed)
+
 
 # ─── CLI ───────────────────────────────────────────────────────────────────────
 
-def main():
-    parser = argparse.ArgumentParser(description='DevDoc Snapshot Manager')
-    subparsers = parser.add_subparsers(dest='command', required=True)
+def _print_json(result: dict):
+    """Pretty-print to stdout chunk by chunk, without building the whole string.
+
+    Stays on stdlib json: orjson would print infinite pct_change values as null.
+    """
+    json.dump(result, sys.stdout, indent=2, default=str)
+    sys.stdout.write('\n')
+
 
-    # save
-    save_p = subparsers.add_parser('save', help='Save an analysis snapshot')
+def _add_save_args(save_p):
     save_p.add_argument('analysis_file', help='Path to analysis JSON file')
     save_p.add_argument('--project-dir', default='.', help='Project root directory')
     save_p.add_argument('--label', help='Optional label for this snapshot')
+    save_p.add_argument('--durable', action='store_true',
+                        help='fsync the snapshot and index before renaming them into place')
 
-    # list
-    list_p = subparsers.add_parser('list', help='List all snapshots')
+
+def _add_list_args(list_p):
     list_p.add_argument('--project-dir', default='.', help='Project root directory')
 
-    # diff
-    diff_p = subparsers.add_parser('diff', help='Compare two snapshots')
+
+def _add_diff_args(diff_p):
     diff_p.add_argument('--older', type=int, default=1, help='Older snapshot index (default: 1)')
     diff_p.add_argument('--newer', type=int, default=0, help='Newer snapshot index (default: 0)')
     diff_p.add_argument('--project-dir', default='.', help='Project root directory')
 
-    # trend
-    trend_p = subparsers.add_parser('trend', help='Show trends across snapshots')
+
+def _add_trend_args(trend_p):
     trend_p.add_argument('--max', type=int, default=20, help='Max snapshots to analyze')
     trend_p.add_argument('--project-dir', default='.', help='Project root directory')
 
-    args = parser.parse_args()
-    mgr = SnapshotManager(args.project_dir)
+
+# command -> (help, argument builder)
+COMMANDS = {
+    'save': ('Save an analysis snapshot', _add_save_args),
+    'list': ('List all snapshots', _add_list_args),
+    'diff': ('Compare two snapshots', _add_diff_args),
+    'trend': ('Show trends across snapshots', _add_trend_args),
+    # Same arguments as list: just the project directory
+    'prune': ('Delete stored analyses no snapshot uses', _add_list_args),
+}
+
+
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with ``command``, only that subparser is built."""
+    parser = argparse.ArgumentParser(description='DevDoc Snapshot Manager')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (help_text, add_args) in COMMANDS.items():
+        if command is None or name == command:
+            add_args(subparsers.add_parser(name, help=help_text))
+    return parser
+
+
+def main():
+    # A known command up front needs only its own subparser; anything else
+    # (--help, typos) gets the full parser for its help and error messages
+    command = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] in COMMANDS else None
+    args = _build_parser(command).parse_args()
+    mgr = SnapshotManager(args.project_dir, durable=getattr(args, 'durable', False))
 
     if args.command == 'save':
-        with open(args.analysis_file, 'r') as f:
-            analysis = json.load(f)
+        analysis = _load_json(args.analysis_file)
         filename = mgr.save(analysis, label=args.label)
         print(f"Snapshot saved: {filename}", file=sys.stderr)
 
@@ -326,15 +705,27 @@ def main():
             print(f"  [{i}] {snap.get('timestamp', '?')}{label} — {snap.get('filename', '?')}")
 
     elif args.command == 'diff':
-        result = mgr.diff(args.older, args.newer)
+        try:
+            result = mgr.diff(args.older, args.newer)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
         if result:
-            print(json.dumps(result, indent=2, default=str))
+            _print_json(_round_diff(result))
         else:
             print("Not enough snapshots for comparison.", file=sys.stderr)
 
     elif args.command == 'trend':
         result = mgr.trend(args.max)
-        print(json.dumps(result, indent=2, default=str))
+        _print_json(result)
+
+    elif args.command == 'prune':
+        try:
+            removed = mgr.prune()
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Pruned {len(removed)} unused blob(s).", file=sys.stderr)
 
 
 if __name__ == '__main__':
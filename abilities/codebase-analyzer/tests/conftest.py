@@ -0,0 +1,6 @@
+"""Make the ability's scripts importable, as they are when run directly."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
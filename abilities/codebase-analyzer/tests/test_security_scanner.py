@@ -0,0 +1,25 @@
+"""Tests for the security scanner."""
+
+import pytest
+from security_scanner import SecurityScanner
+
+
+@pytest.fixture
+def non_utf8_project(tmp_path):
+    """A project whose only module has an invalid UTF-8 byte and no coding line."""
+    (tmp_path / 'legacy.py').write_bytes(
+        b'x = "\xff"\n'
+        b'API_KEY = "sk_live_0123456789abcdef"\n'
+        b'\n'
+        b'def run(y):\n'
+        b'    return eval(y)\n'
+    )
+    return tmp_path
+
+
+def test_non_utf8_file_keeps_ast_findings(non_utf8_project):
+    results = SecurityScanner(str(non_utf8_project), {'cache': False, 'workers': 1}).scan()
+    found = {(f['severity'], f['category'], f['line']) for f in results['findings']}
+    assert ('CRITICAL', 'dangerous_function', 5) in found
+    assert ('HIGH', 'hardcoded_secret', 2) in found
+    assert ('HIGH', 'secrets', 2) in found
@@ -0,0 +1,63 @@
+"""Tests for the snapshot manager."""
+
+import hashlib
+import json
+
+import pytest
+from snapshot_manager import SnapshotManager
+
+
+def analysis(avg_complexity=2.0):
+    return {
+        'project_metrics': {'avg_complexity': avg_complexity, 'ratio': 1e16, 'tiny': 1e-7},
+        'summary': {'total_files': 1, 'owner': 'Zoë'},
+        'file_analyses': [],
+    }
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return SnapshotManager(str(tmp_path))
+
+
+def test_content_hash_is_sha256_of_canonical_stdlib_json(manager):
+    data = analysis()
+    filename = manager.save(data)
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str).encode()
+    digest = hashlib.sha256(canonical).hexdigest()
+    assert filename.endswith(f'_{digest[:8]}.json')
+    blobs = list((manager.snapshot_dir / 'blobs').iterdir())
+    assert [blob.name.split('.')[0] for blob in blobs] == [digest]
+
+
+@pytest.fixture
+def two_snapshots(manager):
+    """Save two snapshots; returns (snapshot path, blob path) pairs, oldest first."""
+    pairs = []
+    for avg_complexity in (2.0, 3.0):
+        snapshot = manager.snapshot_dir / manager.save(analysis(avg_complexity))
+        blob = manager.snapshot_dir / json.loads(snapshot.read_bytes())['blob']
+        pairs.append((snapshot, blob))
+    return pairs
+
+
+def test_diff_reports_missing_blob(manager, two_snapshots):
+    two_snapshots[0][1].unlink()
+    with pytest.raises(OSError, match='points at unreadable blob'):
+        SnapshotManager(str(manager.project_dir)).diff()
+
+
+def test_trend_skips_snapshot_with_missing_blob(manager, two_snapshots):
+    two_snapshots[0][1].unlink()
+    (manager.snapshot_dir / 'index.json').unlink()  # rebuilt without trend rows
+    result = SnapshotManager(str(manager.project_dir)).trend()
+    assert [point['avg_complexity'] for point in result['data_points']] == [3.0]
+
+
+def test_prune_deletes_only_unused_blobs(manager, two_snapshots):
+    (old_snapshot, old_blob), (_, new_blob) = two_snapshots
+    old_snapshot.unlink()
+    manager = SnapshotManager(str(manager.project_dir))
+    assert manager.prune() == [f'blobs/{old_blob.name}']
+    assert [p.name for p in new_blob.parent.iterdir()] == [new_blob.name]
+    assert manager.load()['analysis'] == analysis(3.0)
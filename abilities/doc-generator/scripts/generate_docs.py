@@ -216,10 +216,11 @@ class DocumentationGenerator:
                 mermaid_lines.append(f'    style {node_ids[fp]} fill:#ff9800,stroke:#e65100')
 
         mermaid_lines.append('```')
+        mermaid = '\n'.join(mermaid_lines)
 
         return f"""### Dependency Graph
 
-{chr(10).join(mermaid_lines)}
+{mermaid}
 
 > Orange nodes have high fan-in (3+ modules depend on them) — changes carry higher risk."""
 
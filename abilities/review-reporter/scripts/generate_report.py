@@ -20,13 +20,40 @@ Usage:
 Part of the review-reporter WithAI ability.
 """
 
+import io
+import os
 import json
 import sys
+import itertools
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+_SEVERITY_ICON = {'CRITICAL': '🔴', 'HIGH': '🟠', 'MEDIUM': '🟡', 'LOW': '🟢'}
+_SEVERITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+# Indexed by the sign of a percentage change, shifted to 0..2.
+_TREND_ICONS = ('📉', '➡️', '📈')
+
+_NO_RISKS = """## Risk Assessment
+
+🟢 **No significant risks identified.** The codebase maintains acceptable risk levels across all dimensions."""
+
+
+def _grade(score) -> str:
+    if score >= 90: return 'A'
+    if score >= 75: return 'B'
+    if score >= 60: return 'C'
+    if score >= 45: return 'D'
+    return 'F'
+
 
 class ReviewReporter:
     """Generates comprehensive code review report cards."""
@@ -39,40 +66,67 @@ class ReviewReporter:
         self.governance = governance or {}
         self.architecture = architecture or {}
         self.diff = diff or {}
+        # Inputs read by several sections, fetched once.
+        self._metrics = analysis.get('project_metrics', {}) or {}
+        self._summary = analysis.get('summary', {}) or {}
+        self._sec_findings = self.security.get('findings', []) or []
+        self._gov_findings = self.governance.get('findings', []) or []
+        self._bottlenecks = self.architecture.get('bottlenecks', []) or []
+        # Without any of these (the usual CI case with only analysis.json)
+        # the risk and findings sections are known to be empty up front.
+        self._has_findings = bool(self._sec_findings or self._gov_findings or self._bottlenecks)
+        # Stamped once so every render of this reporter carries the same date.
+        self._report_time = datetime.now().strftime('%B %d, %Y at %H:%M')
+        self._buf: list[str] = []
+        self._overall: Optional[dict] = None
 
     def generate(self) -> str:
         """Generate the full review report."""
-        sections = [
-            self._header(),
-            self._executive_summary(),
-            self._scorecard(),
-            self._risk_matrix(),
-            self._regression_section(),
-            self._hotspot_analysis(),
-            self._action_items(),
-            self._detailed_findings(),
-            self._footer(),
-        ]
-
-        return '\n\n'.join(s for s in sections if s)
+        out = io.StringIO()
+        self.write_to(out)
+        return out.getvalue()
+
+    def write_to(self, fp):
+        """Stream the report into the text file object *fp*, one section at a time."""
+        buf = self._buf
+        sep = ''
+        for emit in (
+            self._emit_header,
+            self._emit_executive_summary,
+            self._emit_scorecard,
+            self._emit_risk_matrix,
+            self._emit_regression_section,
+            self._emit_hotspot_analysis,
+            self._emit_action_items,
+            self._emit_detailed_findings,
+            self._emit_footer,
+        ):
+            buf.clear()
+            emit()
+            # Empty sections are skipped along with their separator.
+            if buf:
+                fp.write(sep)
+                fp.writelines(buf)
+                sep = '\n\n'
+        buf.clear()
 
     # ─── Header ────────────────────────────────────────────────────────────
 
-    def _header(self) -> str:
+    def _emit_header(self):
         name = self.analysis.get('project_name', 'Project')
-        return f"""# {name} — Code Review Report
+        self._buf.append(f"""# {name} — Code Review Report
 
 > **DevDoc Intelligence Platform** — Automated Governance Review
-> Report Date: {datetime.now().strftime('%B %d, %Y at %H:%M')}
-> Analysis Scope: {self.analysis.get('summary', {}).get('total_files', 0)} files, {self.analysis.get('summary', {}).get('total_code_lines', 0):,} lines of code
+> Report Date: {self._report_time}
+> Analysis Scope: {self._summary.get('total_files', 0)} files, {self._summary.get('total_code_lines', 0):,} lines of code
 
----"""
+---""")
 
     # ─── Executive Summary ─────────────────────────────────────────────────
 
-    def _executive_summary(self) -> str:
+    def _emit_executive_summary(self):
         overall = self._compute_overall_score()
-        metrics = self.analysis.get('project_metrics', {})
+        metrics = self._metrics
 
         # Build narrative
         if overall['score'] >= 90:
@@ -86,6 +140,13 @@ class ReviewReporter:
         else:
             assessment = "The codebase is in **poor health**. Multiple critical issues detected. Recommend a dedicated engineering sprint for remediation."
 
+        buf = self._buf
+        buf.append(f"""## Executive Summary
+
+**Overall Health Score: {overall['score']}/100 (Grade: {overall['grade']})**
+
+{assessment}""")
+
         # Highlight specific concerns
         concerns = []
         if metrics.get('docstring_coverage', 0) < 0.5:
@@ -99,19 +160,14 @@ class ReviewReporter:
         if self.governance.get('total_findings', 0) > 5:
             concerns.append(f"{self.governance['total_findings']} AI governance issues detected")
 
-        concern_text = ""
         if concerns:
-            concern_text = "\n\n**Key Concerns:**\n" + '\n'.join(f"- ⚠️ {c}" for c in concerns)
-
-        return f"""## Executive Summary
-
-**Overall Health Score: {overall['score']}/100 (Grade: {overall['grade']})**
-
-{assessment}{concern_text}"""
+            buf.append("\n\n**Key Concerns:**")
+            for c in concerns:
+                buf.append(f"\n- ⚠️ {c}")
 
     # ─── Scorecard ─────────────────────────────────────────────────────────
 
-    def _scorecard(self) -> str:
+    def _emit_scorecard(self):
         overall = self._compute_overall_score()
         breakdown = overall['breakdown']
 
@@ -120,32 +176,32 @@ class ReviewReporter:
             empty = 10 - filled
             return '█' * filled + '░' * empty
 
-        rows = []
+        buf = self._buf
+        buf.append("""## Scorecard
+
+| Dimension | Health Bar | Score | Grade | Weight |
+|-----------|-----------|-------|-------|--------|""")
         for dimension, data in breakdown.items():
             name = dimension.replace('_', ' ').title()
             score = data['score']
             weight = data['weight']
             grade = data['grade']
-            rows.append(
-                f"| {name} | {grade_bar(score)} | {score}/100 | {grade} | {weight:.0%} |"
-            )
-
-        return f"""## Scorecard
-
-| Dimension | Health Bar | Score | Grade | Weight |
-|-----------|-----------|-------|-------|--------|
-{''.join(chr(10) + r for r in rows)}
+            buf.append(f"\n| {name} | {grade_bar(score)} | {score}/100 | {grade} | {weight:.0%} |")
 
-**Weighted Total: {overall['score']}/100 ({overall['grade']})**"""
+        buf.append(f"\n\n**Weighted Total: {overall['score']}/100 ({overall['grade']})**")
 
     # ─── Risk Matrix ───────────────────────────────────────────────────────
 
-    def _risk_matrix(self) -> str:
+    def _emit_risk_matrix(self):
+        buf = self._buf
+        if not self._has_findings:
+            buf.append(_NO_RISKS)
+            return
+
         risks = []
 
         # Architecture risks
-        bottlenecks = self.architecture.get('bottlenecks', [])
-        for b in bottlenecks:
+        for b in self._bottlenecks:
             risks.append({
                 'area': 'Architecture',
                 'risk': f"Bottleneck: {b['file']}",
@@ -155,7 +211,7 @@ class ReviewReporter:
             })
 
         # Security risks
-        for f in self.security.get('findings', []):
+        for f in self._sec_findings:
             if f.get('severity') in ('CRITICAL', 'HIGH'):
                 risks.append({
                     'area': 'Security',
@@ -166,7 +222,7 @@ class ReviewReporter:
                 })
 
         # AI governance risks
-        for f in self.governance.get('findings', []):
+        for f in self._gov_findings:
             if f.get('severity') == 'HIGH':
                 risks.append({
                     'area': 'AI Governance',
@@ -177,34 +233,29 @@ class ReviewReporter:
                 })
 
         if not risks:
-            return """## Risk Assessment
-
-🟢 **No significant risks identified.** The codebase maintains acceptable risk levels across all dimensions."""
+            buf.append(_NO_RISKS)
+            return
 
         # Sort by severity
-        severity_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        risks.sort(key=lambda r: severity_order.get(r['severity'], 4))
-
-        rows = []
-        for r in risks[:15]:
-            severity_icon = {'CRITICAL': '🔴', 'HIGH': '🟠', 'MEDIUM': '🟡', 'LOW': '🟢'}.get(r['severity'], '⬜')
-            rows.append(
-                f"| {severity_icon} {r['severity']} | {r['area']} | {r['risk'][:50]} | {r['impact'][:50]} |"
-            )
+        risks.sort(key=lambda r: _SEVERITY_ORDER.get(r['severity'], 4))
 
-        return f"""## Risk Assessment
+        buf.append("""## Risk Assessment
 
 | Severity | Area | Risk | Impact |
-|----------|------|------|--------|
-{''.join(chr(10) + r for r in rows)}"""
+|----------|------|------|--------|""")
+        for r in risks[:15]:
+            severity_icon = _SEVERITY_ICON.get(r['severity'], '⬜')
+            buf.append(f"\n| {severity_icon} {r['severity']} | {r['area']} | {r['risk'][:50]} | {r['impact'][:50]} |")
 
     # ─── Regression Section ────────────────────────────────────────────────
 
-    def _regression_section(self) -> str:
+    def _emit_regression_section(self):
+        buf = self._buf
         if not self.diff:
-            return """## Regression Check
+            buf.append("""## Regression Check
 
-> No previous snapshot available for comparison. Run DevDoc at least twice to enable regression detection."""
+> No previous snapshot available for comparison. Run DevDoc at least twice to enable regression detection.""")
+            return
 
         regressions = self.diff.get('regressions', [])
         metric_changes = self.diff.get('metric_changes', {})
@@ -215,85 +266,76 @@ class ReviewReporter:
         else:
             status = f"🔴 **{len(regressions)} regression(s) detected.** Review the changes below."
 
-        sections = [f"""## Regression Check
+        buf.append(f"""## Regression Check
 
 {status}
 
 ### Metric Changes
 
 | Metric | Previous | Current | Change | Trend |
-|--------|----------|---------|--------|-------|"""]
+|--------|----------|---------|--------|-------|""")
 
+        regression_metrics = {r['metric'] for r in regressions}
         for metric, data in metric_changes.items():
             pct = data.get('pct_change', 0)
-            trend_icon = '📈' if pct > 0 else '📉' if pct < 0 else '➡️'
+            trend_icon = _TREND_ICONS[(pct > 0) - (pct < 0) + 1]
 
             # Mark regressions
-            is_regression = any(r['metric'] == metric for r in regressions)
-            if is_regression:
+            if metric in regression_metrics:
                 trend_icon = '🔴 ' + trend_icon
 
-            sections.append(
-                f"| {metric.replace('_', ' ').title()} | {data.get('old', '-')} | "
+            buf.append(
+                f"\n| {metric.replace('_', ' ').title()} | {data.get('old', '-')} | "
                 f"{data.get('new', '-')} | {pct:+.1f}% | {trend_icon} |"
             )
 
         # Specific regression details
         if regressions:
-            sections.append("\n### Regression Details\n")
+            buf.append("\n\n### Regression Details\n")
             for r in regressions:
-                sections.append(f"- **[{r['severity']}]** {r['message']}")
+                buf.append(f"\n- **[{r['severity']}]** {r['message']}")
 
         # File-level changes
         file_changes = self.diff.get('file_complexity_changes', [])
         if file_changes:
-            sections.append("\n### File-Level Changes\n")
-            sections.append("| File | Previous Complexity | Current | Direction |")
-            sections.append("|------|--------------------|---------|-----------| ")
+            buf.append("\n\n### File-Level Changes\n"
+                       "\n| File | Previous Complexity | Current | Direction |"
+                       "\n|------|--------------------|---------|-----------| ")
             for fc in file_changes[:10]:
                 icon = '🔴 Worse' if fc['direction'] == 'worse' else '🟢 Better'
-                sections.append(
-                    f"| `{fc['file']}` | {fc['old_complexity']} | {fc['new_complexity']} | {icon} |"
-                )
-
-        return '\n'.join(sections)
+                buf.append(f"\n| `{fc['file']}` | {fc['old_complexity']} | {fc['new_complexity']} | {icon} |")
 
     # ─── Hotspot Analysis ──────────────────────────────────────────────────
 
-    def _hotspot_analysis(self) -> str:
-        metrics = self.analysis.get('project_metrics', {})
+    def _emit_hotspot_analysis(self):
+        metrics = self._metrics
         hotspots = metrics.get('hotspot_functions', [])
         longest = metrics.get('longest_functions', [])
 
         if not hotspots and not longest:
-            return ''
+            return
 
-        sections = ["## Code Hotspots\n"]
+        buf = self._buf
+        buf.append("## Code Hotspots\n")
 
         if hotspots:
-            sections.append("### Highest Complexity Functions\n")
-            sections.append("| Function | File | Complexity | Lines | Risk |")
-            sections.append("|----------|------|-----------|-------|------|")
+            buf.append("\n### Highest Complexity Functions\n"
+                       "\n| Function | File | Complexity | Lines | Risk |"
+                       "\n|----------|------|-----------|-------|------|")
             for h in hotspots[:8]:
                 risk = '🔴 Critical' if h['complexity'] > 15 else '🟠 High' if h['complexity'] > 10 else '🟡 Medium'
-                sections.append(
-                    f"| `{h['name']}` | `{h['file']}` | {h['complexity']} | {h['line_count']} | {risk} |"
-                )
+                buf.append(f"\n| `{h['name']}` | `{h['file']}` | {h['complexity']} | {h['line_count']} | {risk} |")
 
         if longest:
-            sections.append("\n### Longest Functions\n")
-            sections.append("| Function | File | Lines | Complexity |")
-            sections.append("|----------|------|-------|-----------|")
+            buf.append("\n\n### Longest Functions\n"
+                       "\n| Function | File | Lines | Complexity |"
+                       "\n|----------|------|-------|-----------|")
             for l in longest[:8]:
-                sections.append(
-                    f"| `{l['name']}` | `{l['file']}` | {l['line_count']} | {l['complexity']} |"
-                )
-
-        return '\n'.join(sections)
+                buf.append(f"\n| `{l['name']}` | `{l['file']}` | {l['line_count']} | {l['complexity']} |")
 
     # ─── Action Items ──────────────────────────────────────────────────────
 
-    def _action_items(self) -> str:
+    def _emit_action_items(self):
         actions = []
         priority = 1
 
@@ -310,7 +352,7 @@ class ReviewReporter:
             priority += 1
 
         # Security actions
-        for f in self.security.get('findings', []):
+        for f in self._sec_findings:
             if f.get('severity') in ('CRITICAL', 'HIGH'):
                 actions.append({
                     'priority': priority,
@@ -335,7 +377,7 @@ class ReviewReporter:
             priority += 1
 
         # Documentation actions
-        metrics = self.analysis.get('project_metrics', {})
+        metrics = self._metrics
         if metrics.get('docstring_coverage', 0) < 0.5:
             actions.append({
                 'priority': priority,
@@ -347,88 +389,93 @@ class ReviewReporter:
             })
             priority += 1
 
+        buf = self._buf
         if not actions:
-            return """## Action Items
-
-✅ **No critical actions required.** The codebase meets quality standards across all dimensions."""
+            buf.append("""## Action Items
 
-        sections = ["""## Action Items
+✅ **No critical actions required.** The codebase meets quality standards across all dimensions.""")
+            return
 
-Prioritized list of improvements, ordered by impact.\n"""]
+        buf.append("""## Action Items
 
-        sections.append("| # | Category | Action | Target | Effort |")
-        sections.append("|---|----------|--------|--------|--------|")
+Prioritized list of improvements, ordered by impact.\n
+| # | Category | Action | Target | Effort |
+|---|----------|--------|--------|--------|""")
         for a in actions[:15]:
-            sections.append(
-                f"| {a['priority']} | {a['category']} | {a['action'][:70]} | "
+            buf.append(
+                f"\n| {a['priority']} | {a['category']} | {a['action'][:70]} | "
                 f"`{a['target'][:30]}` | {a['effort']} |"
             )
 
-        return '\n'.join(sections)
-
     # ─── Detailed Findings ─────────────────────────────────────────────────
 
-    def _detailed_findings(self) -> str:
-        all_findings = []
-
-        # Collect from all sources
-        for f in self.security.get('findings', []):
-            all_findings.append({
-                'source': 'Security',
-                'severity': f.get('severity', 'MEDIUM'),
-                'message': f.get('description', ''),
-                'file': f.get('file', ''),
-                'line': f.get('line', 0),
-            })
-
-        for f in self.governance.get('findings', []):
-            all_findings.append({
-                'source': 'AI Governance',
-                'severity': f.get('severity', 'MEDIUM'),
-                'message': f.get('message', ''),
-                'file': f.get('details', {}).get('file', ''),
-                'line': f.get('details', {}).get('line', 0),
-            })
-
-        for b in self.architecture.get('bottlenecks', []):
-            all_findings.append({
-                'source': 'Architecture',
-                'severity': b.get('severity', 'MEDIUM'),
-                'message': ', '.join(b.get('reasons', [])),
-                'file': b.get('file', ''),
-                'line': 0,
-            })
-
-        if not all_findings:
-            return ''
-
-        # Sort by severity
-        severity_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        all_findings.sort(key=lambda f: severity_order.get(f['severity'], 4))
-
-        sections = ["""## All Findings
+    def _emit_detailed_findings(self):
+        if not self._has_findings:
+            return
+
+        sources = (
+            ('Security', self._sec_findings),
+            ('AI Governance', self._gov_findings),
+            ('Architecture', self._bottlenecks),
+        )
+        count = sum(len(findings) for _, findings in sources)
+
+        # Bucket by severity rank instead of sorting: the domain is five
+        # values and concatenating the buckets keeps each source's order,
+        # exactly like the stable sort did. Once the buckets at or above
+        # some rank already hold a full table, findings at that rank or
+        # below can never be shown and are not collected.
+        limit = 30
+        buckets = ([], [], [], [], [])
+        cutoff = len(buckets)
+        shown = 0
+        for source, findings in sources:
+            for f in findings:
+                severity = f.get('severity', 'MEDIUM')
+                rank = _SEVERITY_ORDER.get(severity, 4)
+                if rank >= cutoff:
+                    continue
+                buckets[rank].append((source, severity, f))
+                shown += 1
+                if shown >= limit:
+                    total = 0
+                    for cutoff, bucket in enumerate(buckets):
+                        total += len(bucket)
+                        if total >= limit:
+                            break
+
+        buf = self._buf
+        buf.append("""## All Findings
 
 <details>
 <summary>Click to expand full findings list ({count} total)</summary>
 
 | # | Severity | Source | File | Finding |
-|---|----------|--------|------|---------|""".format(count=len(all_findings))]
-
-        for i, f in enumerate(all_findings[:30], 1):
-            icon = {'CRITICAL': '🔴', 'HIGH': '🟠', 'MEDIUM': '🟡', 'LOW': '🟢'}.get(f['severity'], '⬜')
-            file_ref = f"`{f['file']}:{f['line']}`" if f['line'] else f"`{f['file']}`" if f['file'] else '—'
-            sections.append(
-                f"| {i} | {icon} {f['severity']} | {f['source']} | {file_ref} | {f['message'][:60]} |"
-            )
-
-        sections.append("\n</details>")
-        return '\n'.join(sections)
+|---|----------|--------|------|---------|""".format(count=count))
+
+        rows = itertools.islice(itertools.chain.from_iterable(buckets), limit)
+        for i, (source, severity, f) in enumerate(rows, 1):
+            if source == 'Security':
+                file, line, message = f.get('file', ''), f.get('line', 0), f.get('description', '')
+            elif source == 'AI Governance':
+                details = f.get('details', {})
+                file, line, message = details.get('file', ''), details.get('line', 0), f.get('message', '')
+            else:
+                file, line, message = f.get('file', ''), 0, ', '.join(f.get('reasons', []))
+            icon = _SEVERITY_ICON.get(severity, '⬜')
+            file_ref = f"`{file}:{line}`" if line else f"`{file}`" if file else '—'
+            buf.append(f"\n| {i} | {icon} {severity} | {source} | {file_ref} | {message[:60]} |")
+
+        buf.append("\n\n</details>")
 
     # ─── Scoring ───────────────────────────────────────────────────────────
 
     def _compute_overall_score(self) -> dict:
-        """Compute weighted overall health score."""
-        metrics = self.analysis.get('project_metrics', {})
+        """Compute weighted overall health score (memoized per reporter)."""
+        if self._overall is not None:
+            return self._overall
+
+        metrics = self._metrics
 
         # Individual dimension scores
         dimensions = {}
@@ -436,55 +483,49 @@ Prioritized list of improvements, ordered by impact.\n"""]
         # Complexity score
         avg_cx = metrics.get('avg_complexity', 0)
         cx_score = max(0, min(100, 100 - (avg_cx - 3) * 15))
-        dimensions['complexity'] = {'score': round(cx_score), 'weight': 0.20, 'grade': self._grade(cx_score)}
+        dimensions['complexity'] = {'score': round(cx_score), 'weight': 0.20, 'grade': _grade(cx_score)}
 
         # Architecture score
         arch_score = self.architecture.get('architecture_score', 80)
-        dimensions['architecture'] = {'score': arch_score, 'weight': 0.20, 'grade': self._grade(arch_score)}
+        dimensions['architecture'] = {'score': arch_score, 'weight': 0.20, 'grade': _grade(arch_score)}
 
         # Documentation score
         doc_cov = metrics.get('docstring_coverage', 0)
         doc_score = round(doc_cov * 100)
-        dimensions['documentation'] = {'score': doc_score, 'weight': 0.15, 'grade': self._grade(doc_score)}
+        dimensions['documentation'] = {'score': doc_score, 'weight': 0.15, 'grade': _grade(doc_score)}
 
         # Testing (binary check since we can't deep-analyze test quality here)
-        has_tests = self.analysis.get('summary', {}).get('has_tests', False)
+        has_tests = self._summary.get('has_tests', False)
         test_score = 70 if has_tests else 20
-        dimensions['testing'] = {'score': test_score, 'weight': 0.15, 'grade': self._grade(test_score)}
+        dimensions['testing'] = {'score': test_score, 'weight': 0.15, 'grade': _grade(test_score)}
 
         # Security score
         sec_score = self.security.get('security_score', 85)
-        dimensions['security'] = {'score': sec_score, 'weight': 0.15, 'grade': self._grade(sec_score)}
+        dimensions['security'] = {'score': sec_score, 'weight': 0.15, 'grade': _grade(sec_score)}
 
         # AI Governance score
         gov_score = self.governance.get('governance_score', 85)
-        dimensions['ai_governance'] = {'score': gov_score, 'weight': 0.15, 'grade': self._grade(gov_score)}
+        dimensions['ai_governance'] = {'score': gov_score, 'weight': 0.15, 'grade': _grade(gov_score)}
 
         # Weighted total
         total = sum(d['score'] * d['weight'] for d in dimensions.values())
         total = round(total)
 
-        return {
+        self._overall = {
             'score': total,
-            'grade': self._grade(total),
+            'grade': _grade(total),
             'breakdown': dimensions,
         }
-
-    def _grade(self, score) -> str:
-        if score >= 90: return 'A'
-        if score >= 75: return 'B'
-        if score >= 60: return 'C'
-        if score >= 45: return 'D'
-        return 'F'
+        return self._overall
 
     # ─── Footer ────────────────────────────────────────────────────────────
 
-    def _footer(self) -> str:
-        return """---
+    def _emit_footer(self):
+        self._buf.append("""---
 
 *This report was generated by **DevDoc Intelligence Platform**.*
 *For continuous monitoring, integrate DevDoc into your CI/CD pipeline using the included GitHub Action.*
-*Open this file in WithAI's WYSIWYG editor for visual editing, or export to PDF.*"""
+*Open this file in WithAI's WYSIWYG editor for visual editing, or export to PDF.*""")
 
 
 # ─── CLI ───────────────────────────────────────────────────────────────────────
@@ -501,26 +542,48 @@ def main():
 
     def load_json(path):
         if path and Path(path).exists():
-            with open(path) as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                data = f.read()
+            if orjson is not None:
+                try:
+                    return orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    pass  # e.g. the Infinity pct_change in diff.json
+            return json.loads(data)
         return None
 
-    analysis = load_json(args.analysis) or {}
-    security = load_json(args.security)
-    governance = load_json(args.governance)
-    architecture = load_json(args.architecture)
-    diff = load_json(args.diff)
-
-    reporter = ReviewReporter(analysis, security, governance, architecture, diff)
-    markdown = reporter.generate()
+    # The inputs are independent; overlap their reads.
+    paths = {
+        'analysis': args.analysis,
+        'security': args.security,
+        'governance': args.governance,
+        'architecture': args.architecture,
+        'diff': args.diff,
+    }
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        futures = {name: pool.submit(load_json, path) for name, path in paths.items()}
+        loaded = {name: future.result() for name, future in futures.items()}
+    loaded['analysis'] = loaded['analysis'] or {}
+
+    reporter = ReviewReporter(**loaded)
 
     if args.output:
-        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(args.output, 'w') as f:
-            f.write(markdown)
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        # Stream into a sibling temp file so a failure part-way through
+        # never leaves a truncated report in place of the previous one.
+        tmp = output.with_name(output.name + '.tmp')
+        try:
+            with open(tmp, 'w', buffering=1 << 16) as f:
+                reporter.write_to(f)
+            os.replace(tmp, output)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
         print(f"Review report saved to: {args.output}", file=sys.stderr)
     else:
-        print(markdown)
+        reporter.write_to(sys.stdout)
+        sys.stdout.write('\n')
 
 
 if __name__ == '__main__':
@@ -41,7 +41,7 @@ def create_app(config=None):
     def health():
         return jsonify({'status': 'healthy', 'version': '1.0.0'})
 
-    logger.info(f"TaskFlow API initialized (DB: {app.config['DATABASE_URL']})")
+    logger.info("TaskFlow API initialized (DB: %s)", app.config['DATABASE_URL'])
     return app
 
 
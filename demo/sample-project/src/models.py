@@ -7,7 +7,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from enum import Enum
-import uuid
+import operator
+import secrets
 
 
 class Priority(Enum):
@@ -24,7 +25,27 @@ class Status(Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+_created_at = operator.attrgetter('created_at')
+
+_PRIORITY_BY_VALUE = {p.value: p for p in Priority}
+_STATUS_BY_VALUE = {s.value: s for s in Status}
+
+
+def _to_priority(value) -> Priority:
+    try:
+        return _PRIORITY_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return Priority(value)  # members pass through; bad values raise ValueError
+
+
+def _to_status(value) -> Status:
+    try:
+        return _STATUS_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return Status(value)
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a single task in the system."""
     title: str
@@ -33,12 +54,22 @@ class Task:
     status: Status = Status.TODO
     assignee: Optional[str] = None
     tags: list[str] = field(default_factory=list)
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: secrets.token_hex(4))
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # (updated_at, dict) from the last to_dict() call.
+    _cached_dict: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        return {
+        """Serialize the task, reusing the last result until updated_at changes.
+
+        TaskStore.update stamps a fresh updated_at on every change, which
+        invalidates the cache; code mutating a task directly must do the same.
+        """
+        cached = self._cached_dict
+        if cached is not None and cached[0] is self.updated_at:
+            return cached[1]
+        d = {
             'id': self.id,
             'title': self.title,
             'description': self.description,
@@ -49,29 +80,51 @@ class Task:
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
         }
+        self._cached_dict = (self.updated_at, d)
+        return d
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Task':
         return cls(
             title=data['title'],
             description=data.get('description', ''),
-            priority=Priority(data.get('priority', 'medium')),
-            status=Status(data.get('status', 'todo')),
+            priority=_to_priority(data.get('priority', 'medium')),
+            status=_to_status(data.get('status', 'todo')),
             assignee=data.get('assignee'),
             tags=data.get('tags', []),
         )
 
 
 class TaskStore:
-    """In-memory task storage with CRUD operations."""
+    """In-memory task storage with CRUD operations.
+
+    Tasks are also indexed by status and priority so filtered listings and
+    stats touch only the matching bucket. The indexes follow changes made
+    through create/update/delete; mutate tasks through update().
+    """
 
     def __init__(self, db_url: str = "sqlite:///tasks.db"):
         self.db_url = db_url
         self._tasks: dict[str, Task] = {}
+        # Buckets are dicts rather than sets so they keep insertion order.
+        self._by_status: dict[Status, dict[str, Task]] = {s: {} for s in Status}
+        self._by_priority: dict[Priority, dict[str, Task]] = {p: {} for p in Priority}
+
+    def _index(self, task_id: str, task: Task):
+        self._by_status.setdefault(task.status, {})[task_id] = task
+        self._by_priority.setdefault(task.priority, {})[task_id] = task
+
+    def _unindex(self, task_id: str, status, priority):
+        self._by_status.get(status, {}).pop(task_id, None)
+        self._by_priority.get(priority, {}).pop(task_id, None)
 
     def create(self, task: Task) -> Task:
         """Add a new task to the store."""
+        old = self._tasks.get(task.id)
+        if old is not None:
+            self._unindex(task.id, old.status, old.priority)
         self._tasks[task.id] = task
+        self._index(task.id, task)
         return task
 
     def get(self, task_id: str) -> Optional[Task]:
@@ -81,12 +134,29 @@ class TaskStore:
     def list_all(self, status: Optional[Status] = None,
                  priority: Optional[Priority] = None) -> list[Task]:
         """List tasks with optional filters."""
-        tasks = list(self._tasks.values())
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-        if priority:
-            tasks = [t for t in tasks if t.priority == priority]
-        return sorted(tasks, key=lambda t: t.created_at, reverse=True)
+        # Enum members are singletons, so identity checks are exact.
+        if status is not None and priority is not None:
+            by_status = self._by_status.get(status, {})
+            by_priority = self._by_priority.get(priority, {})
+            if len(by_status) <= len(by_priority):
+                tasks = (t for t in by_status.values() if t.priority is priority)
+            else:
+                tasks = (t for t in by_priority.values() if t.status is status)
+        elif status is not None:
+            tasks = self._by_status.get(status, {}).values()
+        elif priority is not None:
+            tasks = self._by_priority.get(priority, {}).values()
+        else:
+            tasks = self._tasks.values()
+        return sorted(tasks, key=_created_at, reverse=True)
+
+    def status_counts(self) -> dict[Status, int]:
+        """Return the number of tasks in each status."""
+        return {s: len(self._by_status.get(s, ())) for s in Status}
+
+    def priority_counts(self) -> dict[Priority, int]:
+        """Return the number of tasks at each priority."""
+        return {p: len(self._by_priority.get(p, ())) for p in Priority}
 
     def update(self, task_id: str, updates: dict) -> Optional[Task]:
         """Update a task's fields."""
@@ -94,23 +164,41 @@ class TaskStore:
         if not task:
             return None
 
+        # Convert every value before touching the task, so a bad one raises
+        # with the task (and its index entries) left as they were.
+        changes = {}
         for key, value in updates.items():
             if key == 'priority':
-                value = Priority(value)
+                value = _to_priority(value)
             elif key == 'status':
-                value = Status(value)
-            if hasattr(task, key):
-                setattr(task, key, value)
+                value = _to_status(value)
+            if hasattr(task, key) and not key.startswith('_'):
+                changes[key] = value
+
+        status, priority = task.status, task.priority
+        for key, value in changes.items():
+            setattr(task, key, value)
+
+        if task.status is not status or task.priority is not priority:
+            self._unindex(task_id, status, priority)
+            self._index(task_id, task)
 
         task.updated_at = datetime.now()
         return task
 
     def delete(self, task_id: str) -> bool:
         """Delete a task by ID."""
-        if task_id in self._tasks:
-            del self._tasks[task_id]
-            return True
-        return False
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        self._unindex(task_id, task.status, task.priority)
+        return True
+
+    def clear(self) -> None:
+        """Remove all tasks."""
+        self._tasks.clear()
+        for bucket in (*self._by_status.values(), *self._by_priority.values()):
+            bucket.clear()
 
     def count(self) -> int:
         """Return total number of tasks."""
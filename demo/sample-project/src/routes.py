@@ -89,20 +89,11 @@ def delete_task(task_id):
 def task_stats():
     """Get task statistics."""
     store = current_app.extensions['task_store']
-    all_tasks = store.list_all()
 
     stats = {
-        'total': len(all_tasks),
-        'by_status': {},
-        'by_priority': {},
+        'total': store.count(),
+        'by_status': {status.value: n for status, n in store.status_counts().items()},
+        'by_priority': {priority.value: n for priority, n in store.priority_counts().items()},
     }
 
-    for status in Status:
-        count = len([t for t in all_tasks if t.status == status])
-        stats['by_status'][status.value] = count
-
-    for priority in Priority:
-        count = len([t for t in all_tasks if t.priority == priority])
-        stats['by_priority'][priority.value] = count
-
     return jsonify(stats)
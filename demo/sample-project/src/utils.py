@@ -3,49 +3,205 @@ Utility functions for TaskFlow API.
 Logging setup, configuration validation, and helper functions.
 """
 
+import atexit
+import bisect
+import itertools
 import logging
+import operator
+import os
+import queue
 import sys
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache, partial
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional, Union
 
 
-def setup_logging(level: str = "INFO") -> logging.Logger:
-    """Configure application logging with structured format."""
-    logger = logging.getLogger('taskflow')
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+class _SecondCachingFormatter(logging.Formatter):
+    """Formatter that reuses the formatted asctime for records in the same second."""
+
+    _last: tuple = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        last_second, last_text = self._last
+        if second != last_second:
+            last_text = time.strftime(datefmt, self.converter(record.created))
+            self._last = (second, last_text)
+        return last_text
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the listener, except for WARNING+."""
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry."""
+
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+
+_log = logging.getLogger('taskflow')
+_LEVELS = {name: getattr(logging, name)
+           for name in ('CRITICAL', 'FATAL', 'ERROR', 'WARNING', 'WARN', 'INFO', 'DEBUG', 'NOTSET')}
+_log_listener: Optional[QueueListener] = None
+
+# Checked in this order, so the first missing key is the one reported.
+_REQUIRED_CONFIG_KEYS = ('SECRET_KEY', 'DATABASE_URL')
+
+
+def _stop_log_listener():
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+def _restart_log_listener(queue_handler: QueueHandler, handler: logging.Handler):
+    """Give a forked child its own queue and listener; the parent's thread is gone."""
+    global _log_listener
+    log_queue = queue.Queue(-1)
+    queue_handler.queue = log_queue
+    _log_listener = _FlushingQueueListener(log_queue, handler)
+    _log_listener.start()
+
+
+@lru_cache(maxsize=None)
+def _taskflow_logger() -> logging.Logger:
+    """Return the 'taskflow' logger, attaching its handler on first use."""
+    logger = _log
 
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
+        handler = _BatchingStreamHandler(sys.stdout)
+        formatter = _SecondCachingFormatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        # Request threads only enqueue records. QueueHandler.prepare()
+        # still merges the args and renders any traceback there, but the
+        # format string, timestamp and write to stdout run on the
+        # listener's background thread, which flushes once per burst
+        # rather than once per record.
+        global _log_listener
+        log_queue = queue.Queue(-1)
+        _log_listener = _FlushingQueueListener(log_queue, handler)
+        _log_listener.start()
+        atexit.register(_stop_log_listener)
+        queue_handler = QueueHandler(log_queue)
+        logger.addHandler(queue_handler)
+        # A forked child (e.g. a gunicorn --preload worker) has no listener
+        # thread, so it gets a fresh one. Flushing first keeps buffered
+        # output from being written by both processes.
+        os.register_at_fork(
+            before=handler.flush,
+            after_in_child=partial(_restart_log_listener, queue_handler, handler),
+        )
 
     return logger
 
 
+def setup_logging(level: str = "INFO") -> logging.Logger:
+    """Configure application logging with structured format."""
+    logger = _taskflow_logger()
+    logger.setLevel(_LEVELS.get(level.upper(), logging.INFO))
+    return logger
+
+
 def validate_config(config: dict[str, Any]) -> None:
     """Validate that required configuration values are present and valid."""
-    required_keys = ['SECRET_KEY', 'DATABASE_URL']
-    for key in required_keys:
-        if key not in config or not config[key]:
+    for key in _REQUIRED_CONFIG_KEYS:
+        if not config.get(key):
             raise ValueError(f"Missing required config: {key}")
 
-    if config.get('SECRET_KEY') == 'dev-secret-key':
-        logging.getLogger('taskflow').warning(
+    if config['SECRET_KEY'] == 'dev-secret-key':
+        _log.warning(
             "Using default SECRET_KEY — set SECRET_KEY env var in production"
         )
 
 
-def paginate(items: list, page: int = 1, per_page: int = 20) -> dict:
-    """Paginate a list of items."""
-    total = len(items)
+_COUNT_CACHE_SIZE = 128
+_count_cache: OrderedDict = OrderedDict()
+_count_cache_lock = threading.Lock()
+
+
+def _cached_count(cache_key: str, version: int, count_fn: Callable[[], int]) -> int:
+    """Return count_fn()'s result, memoized per (cache_key, version) in a small LRU."""
+    key = (cache_key, version)
+    with _count_cache_lock:
+        if key in _count_cache:
+            _count_cache.move_to_end(key)
+            return _count_cache[key]
+    total = count_fn()
+    with _count_cache_lock:
+        _count_cache[key] = total
+        _count_cache.move_to_end(key)
+        if len(_count_cache) > _COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
+    return total
+
+
+def paginate(items: Union[Sequence, Iterable, Callable[[int, int], Any]],
+             page: int = 1, per_page: int = 20,
+             count: Union[int, Callable[[], int], None] = None,
+             cache_key: Optional[str] = None, version: int = 0) -> dict:
+    """Paginate a collection without materializing more than one page.
+
+    ``items`` may be a sequence (sliced directly), a callable
+    ``(offset, limit) -> (items, total)`` that fetches just the page, or any
+    other iterable, which is consumed only up to the end of the page and
+    then needs ``count`` for the total.
+
+    ``count`` overrides the total and may be a zero-argument callable such
+    as a ``COUNT(*)`` query; a callable ``items`` then returns only the page's
+    items. Passing ``cache_key`` memoizes a callable count per
+    ``(cache_key, version)`` across calls; bump ``version`` when the
+    underlying data changes.
+    """
     start = (page - 1) * per_page
     end = start + per_page
 
+    if callable(count):
+        total = _cached_count(cache_key, version, count) if cache_key is not None else count()
+    else:
+        total = count
+
+    # Plain lists are the common case; checking for them first skips the
+    # comparatively slow isinstance() against the Sequence ABC.
+    if items.__class__ is list or (not callable(items) and isinstance(items, Sequence)):
+        page_items = items[start:end]
+        if total is None:
+            total = len(items)
+    elif callable(items):
+        if total is None:
+            page_items, total = items(start, per_page)
+        else:
+            page_items = items(start, per_page)
+    else:
+        if total is None:
+            raise TypeError("paginate() needs count= when given a plain iterable")
+        page_items = list(itertools.islice(items, max(start, 0), max(end, 0)))
+
     return {
-        'items': items[start:end],
+        'items': page_items,
         'page': page,
         'per_page': per_page,
         'total': total,
@@ -55,8 +211,52 @@ def paginate(items: list, page: int = 1, per_page: int = 20) -> dict:
     }
 
 
+def _order_getter(item, order_key: str) -> Callable[[Any], Any]:
+    if isinstance(item, Mapping):
+        return operator.itemgetter(order_key)
+    return operator.attrgetter(order_key)
+
+
+def paginate_keyset(source: Union[Sequence, Callable[[Any, int], list]],
+                    after: Any = None, per_page: int = 20, order_key: str = 'id') -> dict:
+    """Paginate by cursor: return the ``per_page`` items ordered after ``after``.
+
+    Unlike offset pagination the cost does not grow with page depth.
+    ``source`` is either a sequence already sorted by ``order_key`` (the
+    cursor is located by binary search) or a callable
+    ``(after, limit) -> items`` that fetches rows past the cursor itself,
+    e.g. ``WHERE id > ? ORDER BY id LIMIT ?``. Items may be mappings or
+    objects; ``next_cursor`` is passed back as ``after`` for the next page.
+    Every row whose key equals ``after`` is skipped, so keys should be unique.
+    """
+    if callable(source):
+        # One extra row tells us whether another page exists.
+        rows = source(after, per_page + 1)
+        has_next = len(rows) > per_page
+        items = rows[:per_page]
+    else:
+        start = 0
+        if after is not None and source:
+            start = bisect.bisect_right(source, after, key=_order_getter(source[0], order_key))
+        items = source[start:start + per_page]
+        has_next = start + per_page < len(source)
+
+    next_cursor = _order_getter(items[-1], order_key)(items[-1]) if has_next and items else None
+    return {
+        'items': items,
+        'next_cursor': next_cursor,
+        'has_next': has_next,
+        'per_page': per_page,
+    }
+
+
 def sanitize_input(text: str, max_length: int = 500) -> str:
     """Basic input sanitization."""
     if not isinstance(text, str):
         return str(text)
     return text.strip()[:max_length]
+
+
+def sanitize_many(texts: Iterable, max_length: int = 500) -> list[str]:
+    """Sanitize a batch of inputs with the same rules as sanitize_input."""
+    return [t.strip()[:max_length] if isinstance(t, str) else str(t) for t in texts]
@@ -0,0 +1,29 @@
+"""Shared fixtures for TaskFlow API tests."""
+
+import pytest
+from app import create_app
+from models import Task
+
+
+@pytest.fixture(scope='session')
+def app():
+    return create_app({'TESTING': True})
+
+
+@pytest.fixture
+def client(app):
+    with app.test_client() as client:
+        yield client
+    # The app is shared by the whole session; give each test an empty store.
+    app.extensions['task_store'].clear()
+
+
+@pytest.fixture
+def seed_tasks(app):
+    """Insert tasks straight into the store, bypassing the HTTP layer."""
+    store = app.extensions['task_store']
+
+    def seed(tasks: list[dict]) -> list[Task]:
+        return [store.create(Task.from_dict(data)) for data in tasks]
+
+    return seed
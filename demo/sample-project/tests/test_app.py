@@ -1,20 +1,22 @@
 """Tests for TaskFlow API."""
 
-import pytest
-from app import create_app
+try:
+    import orjson
+except ImportError:  # optional speedup; Flask's stdlib-based decoder is the fallback
+    orjson = None
 
 
-@pytest.fixture
-def client():
-    app = create_app({'TESTING': True})
-    with app.test_client() as client:
-        yield client
+def json_of(response):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.data)
+    return response.get_json()
 
 
 def test_health_check(client):
     response = client.get('/health')
     assert response.status_code == 200
-    data = response.get_json()
+    data = json_of(response)
     assert data['status'] == 'healthy'
 
 
@@ -25,7 +27,7 @@ def test_create_task(client):
         'priority': 'high',
     })
     assert response.status_code == 201
-    data = response.get_json()
+    data = json_of(response)
     assert data['title'] == 'Write tests'
     assert data['priority'] == 'high'
     assert data['status'] == 'todo'
@@ -38,14 +40,12 @@ def test_create_task_missing_title(client):
     assert response.status_code == 400
 
 
-def test_list_tasks(client):
-    # Create two tasks
-    client.post('/api/v1/tasks', json={'title': 'Task 1'})
-    client.post('/api/v1/tasks', json={'title': 'Task 2'})
+def test_list_tasks(client, seed_tasks):
+    seed_tasks([{'title': 'Task 1'}, {'title': 'Task 2'}])
 
     response = client.get('/api/v1/tasks')
     assert response.status_code == 200
-    data = response.get_json()
+    data = json_of(response)
     assert data['total'] == 2
 
 
@@ -57,7 +57,29 @@ def test_get_task_not_found(client):
 def test_delete_task(client):
     # Create then delete
     create_resp = client.post('/api/v1/tasks', json={'title': 'To delete'})
-    task_id = create_resp.get_json()['id']
+    task_id = json_of(create_resp)['id']
 
     delete_resp = client.delete(f'/api/v1/tasks/{task_id}')
     assert delete_resp.status_code == 200
+
+
+def test_stats_and_filters_follow_status_changes(client, seed_tasks):
+    first, _, _ = seed_tasks([
+        {'title': 'Task 1', 'priority': 'high'},
+        {'title': 'Task 2', 'priority': 'high'},
+        {'title': 'Task 3', 'priority': 'low'},
+    ])
+
+    patch_resp = client.patch(f'/api/v1/tasks/{first.id}', json={'status': 'done'})
+    assert patch_resp.status_code == 200
+
+    stats = json_of(client.get('/api/v1/tasks/stats'))
+    assert stats['total'] == 3
+    assert stats['by_status'] == {'todo': 2, 'in_progress': 0, 'done': 1, 'archived': 0}
+    assert stats['by_priority'] == {'low': 1, 'medium': 0, 'high': 2, 'critical': 0}
+
+    done = json_of(client.get('/api/v1/tasks?status=done'))
+    assert done['total'] == 1
+    assert done['tasks'][0]['id'] == first.id
+    assert json_of(client.get('/api/v1/tasks?status=todo'))['total'] == 2
+    assert json_of(client.get('/api/v1/tasks?status=todo&priority=high'))['total'] == 1
@@ -0,0 +1,72 @@
+"""Tests for the task store's status and priority indexes."""
+
+import pytest
+from models import Priority, Status, Task, TaskStore
+
+
+@pytest.fixture
+def store():
+    return TaskStore()
+
+
+def assert_indexed(store):
+    """Every bucket agrees with a full scan of the stored tasks."""
+    tasks = list(store._tasks.values())
+    for status in Status:
+        expected = {t.id for t in tasks if t.status is status}
+        assert {t.id for t in store.list_all(status=status)} == expected
+        assert store.status_counts()[status] == len(expected)
+    for priority in Priority:
+        expected = {t.id for t in tasks if t.priority is priority}
+        assert {t.id for t in store.list_all(priority=priority)} == expected
+        assert store.priority_counts()[priority] == len(expected)
+
+
+def test_update_moves_task_between_buckets(store):
+    task = store.create(Task(title='Ship it'))
+    store.update(task.id, {'status': 'done', 'priority': 'high'})
+    assert store.list_all(status=Status.DONE, priority=Priority.HIGH) == [task]
+    assert store.list_all(status=Status.TODO) == []
+    assert_indexed(store)
+
+
+def test_failed_update_changes_nothing(store):
+    task = store.create(Task(title='Ship it'))
+    with pytest.raises(ValueError):
+        store.update(task.id, {'priority': 'high', 'status': 'bogus'})
+    assert task.priority is Priority.MEDIUM
+    assert task.status is Status.TODO
+    assert_indexed(store)
+
+
+def test_delete_removes_task_from_buckets(store):
+    task = store.create(Task(title='Ship it', priority=Priority.LOW))
+    store.create(Task(title='Keep it'))
+    assert store.delete(task.id)
+    assert store.list_all(priority=Priority.LOW) == []
+    assert_indexed(store)
+
+
+def test_create_with_existing_id_replaces_index_entries(store):
+    old = store.create(Task(title='Old', status=Status.TODO, priority=Priority.LOW))
+    new = store.create(Task(title='New', status=Status.DONE, priority=Priority.HIGH, id=old.id))
+    assert store.count() == 1
+    assert store.list_all(status=Status.TODO) == []
+    assert store.list_all(priority=Priority.HIGH) == [new]
+    assert_indexed(store)
+
+
+def test_to_dict_reuses_cached_dict(store):
+    task = store.create(Task(title='Ship it'))
+    assert task.to_dict() is task.to_dict()
+
+
+def test_update_refreshes_to_dict(store):
+    task = store.create(Task(title='Ship it'))
+    before = task.to_dict()
+    store.update(task.id, {'title': 'Shipped', 'status': 'done'})
+    after = task.to_dict()
+    assert after is not before
+    assert after['title'] == 'Shipped'
+    assert after['status'] == 'done'
+    assert after['updated_at'] == task.updated_at.isoformat()
@@ -0,0 +1,144 @@
+"""Tests for the logging and pagination helpers."""
+
+import itertools
+import os
+from types import SimpleNamespace
+
+import pytest
+import utils
+from utils import paginate, paginate_keyset, setup_logging
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+def test_logging_survives_fork(tmp_path):
+    logger = setup_logging()
+    handler = utils._log_listener.handlers[0]
+    log_path = tmp_path / 'taskflow.log'
+    with open(log_path, 'w') as stream:
+        previous = handler.setStream(stream)
+        try:
+            pid = os.fork()
+            if pid == 0:  # child: log, drain the listener, and leave without pytest's teardown
+                status = 1
+                try:
+                    logger.warning('from child %d', os.getpid())
+                    utils._log_listener.stop()
+                    status = 0
+                finally:
+                    os._exit(status)
+            _, status = os.waitpid(pid, 0)
+        finally:
+            handler.setStream(previous)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert f'WARNING  | taskflow | from child {pid}' in log_path.read_text()
+
+
+def test_paginate_list():
+    result = paginate(list(range(45)), page=3, per_page=20)
+    assert result['items'] == list(range(40, 45))
+    assert result['total'] == 45
+    assert result['total_pages'] == 3
+    assert not result['has_next']
+    assert result['has_prev']
+
+
+def test_paginate_accepts_items_keyword():
+    assert paginate(items=[1, 2, 3], per_page=2)['items'] == [1, 2]
+
+
+def test_paginate_iterable_needs_count():
+    with pytest.raises(TypeError):
+        paginate(iter(range(10)))
+
+
+def test_paginate_iterable_consumes_only_up_to_the_page():
+    source = itertools.count()
+    result = paginate(source, page=2, per_page=5, count=100)
+    assert result['items'] == [5, 6, 7, 8, 9]
+    assert result['has_next']
+    assert next(source) == 10
+
+
+def test_paginate_callable_source():
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append((offset, limit))
+        return list(range(offset, min(offset + limit, 12))), 12
+
+    result = paginate(fetch, page=2, per_page=10)
+    assert calls == [(10, 10)]
+    assert result['items'] == [10, 11]
+    assert result['total'] == 12
+    assert not result['has_next']
+
+
+def test_paginate_callable_source_with_count():
+    result = paginate(lambda offset, limit: ['a', 'b'], per_page=2, count=lambda: 7)
+    assert result['items'] == ['a', 'b']
+    assert result['total'] == 7
+    assert result['has_next']
+
+
+def test_paginate_caches_count_per_key_and_version():
+    counts = []
+
+    def count():
+        counts.append(1)
+        return 30
+
+    for _ in range(3):
+        assert paginate([], count=count, cache_key='test-count')['total'] == 30
+    assert len(counts) == 1
+    paginate([], count=count, cache_key='test-count', version=1)
+    assert len(counts) == 2
+
+
+def walk_keyset(source, per_page, order_key='id'):
+    """Follow next_cursor from the first page to the last; return every page."""
+    pages = [paginate_keyset(source, per_page=per_page, order_key=order_key)]
+    while pages[-1]['has_next']:
+        pages.append(paginate_keyset(source, after=pages[-1]['next_cursor'],
+                                     per_page=per_page, order_key=order_key))
+    return pages
+
+
+@pytest.mark.parametrize('make', [dict, SimpleNamespace])
+def test_paginate_keyset_cursor_round_trip(make):
+    rows = [make(id=i, title=f'task {i}') for i in range(1, 8)]
+    pages = walk_keyset(rows, per_page=3)
+    assert [page['items'] for page in pages] == [rows[0:3], rows[3:6], rows[6:7]]
+    assert [page['next_cursor'] for page in pages] == [3, 6, None]
+
+
+def test_paginate_keyset_empty_source():
+    result = paginate_keyset([], after=5)
+    assert result['items'] == []
+    assert result['next_cursor'] is None
+    assert not result['has_next']
+
+
+def test_paginate_keyset_after_past_the_end():
+    result = paginate_keyset([{'id': 1}, {'id': 2}], after=99)
+    assert result['items'] == []
+    assert not result['has_next']
+
+
+def test_paginate_keyset_skips_every_row_equal_to_the_cursor():
+    rows = [{'id': 1}, {'id': 2}, {'id': 2}, {'id': 3}]
+    assert paginate_keyset(rows, after=2)['items'] == [{'id': 3}]
+
+
+@pytest.mark.parametrize('available, has_next', [(5, True), (4, False)])
+def test_paginate_keyset_callable_probes_one_extra_row(available, has_next):
+    calls = []
+
+    def fetch(after, limit):
+        calls.append((after, limit))
+        return [{'id': after + i} for i in range(1, min(limit, available) + 1)]
+
+    result = paginate_keyset(fetch, after=10, per_page=4)
+    assert calls == [(10, 5)]
+    assert [row['id'] for row in result['items']] == [11, 12, 13, 14]
+    assert result['has_next'] is has_next
+    assert result['next_cursor'] == (14 if has_next else None)